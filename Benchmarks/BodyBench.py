@@ -0,0 +1,62 @@
+from stataLogObject.StataParser import StataScanner
+from stataLogObject.Configs import TableConfigs
+from Benchmarks.LogGenerator import generate_body_log
+
+from pathlib import Path
+import tempfile
+import timeit
+
+
+def reference_body_lines(body_iso, raw):
+    """The original body line extraction, kept to check the rows are identical and to measure the gain against"""
+    skip_indexes = [v if v >= 0 else (len(raw) - 1) + (v + 1) for v in body_iso.skip_indexes]
+    result_indexes = [i for i, line in enumerate(raw) if ("|" in line) and (i not in skip_indexes)]
+
+    body_lines = []
+    for index, line in enumerate(raw):
+        if min(result_indexes) + body_iso.skip_lines <= index and index in result_indexes:
+            values_stripped = [value for value in line if value != "|"]
+            if len(values_stripped) > 1:
+                body_lines.append(values_stripped)
+                if values_stripped[0] == "_cons":
+                    break
+    return body_lines
+
+
+def current_body_lines(body_iso, raw):
+    """The current body line extraction"""
+    return body_iso._extract_body_lines(raw, body_iso._format_indexes(len(raw)))
+
+
+def body_raw_table(directory, rows):
+    """The raw ols table of a log with a body of rows variables"""
+    log_path = Path(directory, f"Body{rows}.log")
+    generate_body_log(log_path, rows)
+    config = TableConfigs().ols
+    return next(StataScanner({"ols": config.table_ext}).scan(log_path)).lines, config.body_iso
+
+
+def seconds(function, repeat=3):
+    """Best of repeat runs of function"""
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main(row_counts=(10, 100, 1000, 10000, 100000), reference_limit=10000):
+    with tempfile.TemporaryDirectory() as directory:
+        print("Body line extraction of an ols table")
+        for rows in row_counts:
+            raw, body_iso = body_raw_table(directory, rows)
+            current = seconds(lambda: current_body_lines(body_iso, raw))
+            line = f"\t{rows:>7} rows: current {current * 1e6 / rows:8.3f}us/row"
+
+            # The reference is quadratic, so is only run on smaller tables
+            if rows <= reference_limit:
+                assert current_body_lines(body_iso, raw) == reference_body_lines(body_iso, raw), \
+                    "Body lines differ from the reference implementation"
+                reference = seconds(lambda: reference_body_lines(body_iso, raw), repeat=1)
+                line += f", reference {reference * 1e6 / rows:10.3f}us/row ({reference / current:.0f}x)"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
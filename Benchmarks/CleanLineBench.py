@@ -0,0 +1,42 @@
+from stataLogObject.Supports import clean_line
+
+from pathlib import Path
+import timeit
+import re
+
+
+def reference_clean_line(line):
+    """The original clean_line, kept to check the tokens are identical and to measure the gain against"""
+    subbed = "".join([re.sub("\n", "", value) for value in line])
+    return [f"-0.{v[2:]}" if v[0:2] == "-." else v for v in subbed.split(" ") if len(v) > 0]
+
+
+def scaled_lines(log_path, scale):
+    """Load the lines of a log, repeated scale times"""
+    with open(log_path, "r") as log_file:
+        return log_file.readlines() * scale
+
+
+def lines_per_second(function, lines, repeat=3):
+    """Best of repeat runs of function over every line, as lines per second"""
+    best = min(timeit.repeat(lambda: [function(line) for line in lines], number=1, repeat=repeat))
+    return len(lines) / best
+
+
+def main(scale=200):
+    log_path = Path(__file__).parent.parent / "DoLogs" / "StataLog.log"
+    lines = scaled_lines(log_path, scale)
+
+    assert [clean_line(line) for line in lines] == [reference_clean_line(line) for line in lines], \
+        "clean_line tokens differ from the reference implementation"
+
+    reference = lines_per_second(reference_clean_line, lines)
+    current = lines_per_second(clean_line, lines)
+    print(f"clean_line over {len(lines)} lines of {log_path.name} x{scale}")
+    print(f"\treference: {reference:,.0f} lines/s")
+    print(f"\tcurrent:   {current:,.0f} lines/s")
+    print(f"\tspeed up:  {current / reference:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
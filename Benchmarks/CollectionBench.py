@@ -0,0 +1,40 @@
+from stataLogObject import StataLogCollection
+
+from pathlib import Path
+import tempfile
+import shutil
+import time
+import os
+
+
+def copy_logs(directory, copies):
+    """Copy each log in DoLogs into directory, copies times, split over sub directories of 100 logs"""
+    log_paths = sorted((Path(__file__).parent.parent / "DoLogs").glob("*.log"))
+    for i in range(copies):
+        sub_directory = Path(directory, f"{i // 100}")
+        sub_directory.mkdir(exist_ok=True)
+        for log_path in log_paths:
+            shutil.copy(log_path, Path(sub_directory, f"{log_path.stem}_{i}.log"))
+    return copies * len(log_paths)
+
+
+def main(copies=500):
+    with tempfile.TemporaryDirectory() as directory:
+        log_count = copy_logs(directory, copies)
+        print(f"StataLogCollection.from_directory over {log_count} logs")
+
+        baseline = None
+        workers = 1
+        while workers <= os.cpu_count():
+            start = time.perf_counter()
+            collection = StataLogCollection.from_directory(directory, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            assert len(collection) == log_count, collection.errors
+            baseline = elapsed if baseline is None else baseline
+            print(f"\tworkers={workers}: {elapsed:.2f}s ({log_count / elapsed:,.0f} logs/s, {baseline / elapsed:.1f}x)")
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+from stataLogObject import StataLog
+
+from pathlib import Path
+import tempfile
+import time
+
+
+def scaled_log(directory, scale):
+    """Write DoLogs/StataLog.log repeated scale times to directory"""
+    with open(Path(Path(__file__).parent.parent, "DoLogs", "StataLog.log"), "r") as log_file:
+        log_text = log_file.read()
+
+    log_path = Path(directory, "Scaled.log")
+    with open(log_path, "w") as log_file:
+        log_file.write(log_text * scale)
+    return log_path
+
+
+def main(scale=200):
+    with tempfile.TemporaryDirectory() as directory:
+        log = StataLog(scaled_log(directory, scale))
+        table_count = sum([len(tables) for tables in log.table_types().values()])
+        print(f"Exporting {table_count} tables of StataLog.log x{scale}")
+
+        csv_directory = Path(directory, "csv")
+        csv_directory.mkdir()
+        start = time.perf_counter()
+        for table_type, tables in log.table_types().items():
+            for i, table in enumerate(tables):
+                table.body_to_csv(csv_directory, f"{table_type}_{i}")
+        csv_time = time.perf_counter() - start
+        print(f"\tbody_to_csv per table: {csv_time:.3f}s")
+
+        for file_format in ["parquet", "feather"]:
+            start = time.perf_counter()
+            getattr(log, f"write_{file_format}")(Path(directory, f"Scaled.{file_format}"))
+            elapsed = time.perf_counter() - start
+            print(f"\twrite_{file_format} single file: {elapsed:.3f}s ({csv_time / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+from pathlib import Path
+import random
+
+
+SAMPLE_LOG = Path(Path(__file__).parent.parent, "DoLogs", "StataLog.log")
+
+# The command of each table shape within the sample log
+TABLE_SHAPES = {
+    "regress": "reg drate medage marriage i.region",
+    "regress_cluster": "reg drate medage marriage i.region, cluster(region)",
+    "xtreg_fe": "xtreg drate medage marriage, fe",
+    "xtreg_fe_cluster": "xtreg drate medage marriage, fe cluster(region)",
+    "xtreg_re": "xtreg drate medage marriage, cluster(region)",
+    "reghdfe": "reghdfe drate medage marriage, absorb(i.region)",
+    "reghdfe_cluster": "reghdfe drate medage marriage, absorb(i.region) cluster(region)",
+    "mixed": "mixed drate medage marriage || region: medage marriage",
+    "probit": "probit north drate",
+    "logit": "logit north drate",
+    "sum": "sum drate medage marriage region i.region",
+    "tab": "tab region"
+}
+
+
+def load_shapes(sample_log=SAMPLE_LOG):
+    """
+    Isolate the output of each command in TABLE_SHAPES from the sample log, where the output of a command is every line
+    from the command until the next command
+
+    :return: A dict of shape name: the command and its output
+    :rtype: dict[str, str]
+    """
+    with open(sample_log, "r") as log_file:
+        lines = log_file.readlines()
+
+    command_indexes = [i for i, line in enumerate(lines) if line.startswith(". ")] + [len(lines)]
+    blocks = {lines[start][2:].strip(): "".join(lines[start:end])
+              for start, end in zip(command_indexes[:-1], command_indexes[1:])}
+    return {name: blocks[command] for name, command in TABLE_SHAPES.items()}
+
+
+def generate_log(log_path, megabytes, shapes=None, seed=0, sample_log=SAMPLE_LOG):
+    """
+    Write a synthetic log of approximately the requested size by randomly mixing and repeating the table shapes of the
+    sample log
+
+    :param log_path: The path to write the log to
+    :type log_path: str | Path
+
+    :param megabytes: The approximate size of the log in megabytes
+    :type megabytes: float
+
+    :param shapes: The shape names from TABLE_SHAPES to include, defaults to None which includes every shape
+    :type shapes: list[str] | None
+
+    :param seed: The random seed used to order the shapes, defaults to 0
+    :type seed: int
+
+    :param sample_log: The log to take table shapes from, defaults to DoLogs/StataLog.log
+    :type sample_log: str | Path
+
+    :return: The number of times each shape was written
+    :rtype: dict[str, int]
+    """
+    blocks = load_shapes(sample_log)
+    names = list(blocks.keys()) if shapes is None else shapes
+    generator = random.Random(seed)
+
+    counts = {name: 0 for name in names}
+    written = 0
+    with open(log_path, "w") as log_file:
+        while written < megabytes * 1024 * 1024:
+            name = generator.choice(names)
+            written += log_file.write(blocks[name])
+            counts[name] += 1
+    return counts
+
+
+def generate_body_log(log_path, rows):
+    """
+    Write a log of a single regression whose body has the requested number of variables, such as a model with
+    thousands of factor level dummies
+
+    :param log_path: The path to write the log to
+    :type log_path: str | Path
+
+    :param rows: The number of variables in the body of the table
+    :type rows: int
+
+    :return: Nothing, writes the log to log_path
+    :rtype: None
+    """
+    block = load_shapes()["regress"]
+    header, body_end = block.split("-------------+----------------------------------------------------------------\n")
+    variable_row = "    var{0:<6}|   4.334293   .7920065     5.47   0.000     2.738109    5.930477\n"
+
+    with open(log_path, "w") as log_file:
+        log_file.write(header)
+        log_file.write("-------------+----------------------------------------------------------------\n")
+        log_file.writelines([variable_row.format(i) for i in range(rows)])
+        log_file.write(body_end[body_end.index("       _cons |"):])
+
+
+def generate_output_log(log_path, megabytes, table_every=10000):
+    """
+    Write a log of approximately the requested size that is mostly command output without tables, such as the data
+    management of a long do-file, with a regression every table_every lines
+
+    :param log_path: The path to write the log to
+    :type log_path: str | Path
+
+    :param megabytes: The approximate size of the log in megabytes
+    :type megabytes: float
+
+    :param table_every: The number of lines of output between each regression, defaults to 10000
+    :type table_every: int
+
+    :return: The number of regressions written
+    :rtype: int
+    """
+    block = load_shapes()["regress"]
+    output = "".join([f". replace var{i} = var{i} * 2 if region == {i % 4}\n({i} real changes made)\n"
+                      for i in range(table_every // 2)])
+
+    tables = 0
+    written = 0
+    with open(log_path, "w") as log_file:
+        while written < megabytes * 1024 * 1024:
+            written += log_file.write(output)
+            written += log_file.write(block)
+            tables += 1
+    return tables
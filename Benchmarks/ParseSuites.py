@@ -0,0 +1,176 @@
+"""
+Benchmark suites for parsing, written in the asv style: each Time class generates a synthetic log in setup and every
+time_ method is one timed benchmark. Run every suite via python -m Benchmarks
+"""
+from stataLogObject.StataParser import StataScanner, StataMap, StataTable
+from stataLogObject.StataParser.StataExport import write_methods
+from stataLogObject.Configs import TableConfigs, ExtractTable
+from stataLogObject.Supports import clean_line
+from stataLogObject import StataLog
+from Benchmarks.LogGenerator import generate_log, generate_body_log, generate_output_log
+
+from pathlib import Path
+import tempfile
+
+
+class TimeStataLog:
+    """End to end parsing of a synthetic log of every table shape"""
+    params = [1, 10]
+    param_names = ["megabytes"]
+
+    def setup(self, megabytes):
+        self._directory = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._directory.name, "Synthetic.log")
+        generate_log(self.log_path, megabytes)
+
+    def teardown(self, megabytes):
+        self._directory.cleanup()
+
+    def time_load(self, megabytes):
+        StataLog(self.log_path).load()
+
+    def time_load_memory_map(self, megabytes):
+        StataLog(self.log_path, memory_map=True).load()
+
+    def time_iter_tables(self, megabytes):
+        for _ in StataLog(self.log_path).iter_tables():
+            pass
+
+
+class TimeStages:
+    """Each stage of parsing in isolation, on the lines or raw tables of a synthetic log"""
+    params = [1]
+    param_names = ["megabytes"]
+
+    def setup(self, megabytes):
+        self._directory = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._directory.name, "Synthetic.log")
+        generate_log(self.log_path, megabytes)
+
+        with open(self.log_path, "r") as log_file:
+            self.lines = log_file.readlines()
+
+        self.configs = TableConfigs().table_types()
+        self.isolators = {name: config.table_ext for name, config in self.configs.items()}
+        self.raw_tables = list(StataScanner(self.isolators).scan(self.log_path))
+        self.tables = [StataTable(list(raw.lines), self.configs[raw.name], raw.name) for raw in self.raw_tables]
+
+    def teardown(self, megabytes):
+        self._directory.cleanup()
+
+    def time_clean_line(self, megabytes):
+        [clean_line(line) for line in self.lines]
+
+    def time_scanner(self, megabytes):
+        list(StataScanner(self.isolators).scan(self.log_path))
+
+    def time_stata_map(self, megabytes):
+        list(StataMap(self.isolators).scan(self.log_path))
+
+    # Stages that extract from a raw table may blank its lines, so each is given a shallow copy
+    def time_model_fit(self, megabytes):
+        [self.configs[raw.name].mf.compile().extract(list(raw.lines)) for raw in self.raw_tables]
+
+    def time_extract_body(self, megabytes):
+        [self.configs[raw.name].body_iso.extract_columns(list(raw.lines)) for raw in self.raw_tables]
+
+    def time_create_entries(self, megabytes):
+        [table.body_values for table in self.tables]
+
+    def time_stata_table(self, megabytes):
+        [StataTable(list(raw.lines), self.configs[raw.name], raw.name) for raw in self.raw_tables]
+
+
+class TimeBodyRows:
+    """Body extraction of a single table as the number of variables in its body grows, which should scale linearly"""
+    params = [10, 1000, 100000]
+    param_names = ["rows"]
+
+    def setup(self, rows):
+        self._directory = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._directory.name, "Body.log")
+        generate_body_log(self.log_path, rows)
+
+        self.config = TableConfigs().ols
+        self.raw = next(StataScanner({"ols": self.config.table_ext}).scan(self.log_path))
+
+    def teardown(self, rows):
+        self._directory.cleanup()
+
+    def time_extract_columns(self, rows):
+        self.config.body_iso.extract_columns(list(self.raw.lines))
+
+
+class TimeDividerDispatch:
+    """Scanning a synthetic log as further table types are added, which should cost the same via the divider trie"""
+    params = [0, 100, 1000]
+    param_names = ["extra_table_types"]
+
+    def setup(self, extra_table_types):
+        self._directory = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._directory.name, "Synthetic.log")
+        generate_log(self.log_path, 1)
+
+        self.isolators = {name: config.table_ext for name, config in TableConfigs().table_types().items()}
+        for i in range(extra_table_types):
+            self.isolators[f"model_{i}"] = ExtractTable([f"Model{i}", "regression", "Number", "of", "obs", "="], 1, [6])
+
+    def teardown(self, extra_table_types):
+        self._directory.cleanup()
+
+    def time_scanner(self, extra_table_types):
+        list(StataScanner(self.isolators).scan(self.log_path))
+
+    def time_stata_map(self, extra_table_types):
+        list(StataMap(self.isolators).scan(self.log_path))
+
+
+class TimeMemoryMap:
+    """
+    StataMap against StataScanner on a log of only tables and on a log that is mostly output without tables, where
+    StataMap should be faster on both as it only decodes the lines containing a divider anchor and the table lines
+    """
+    params = [["tables", "output"], [10]]
+    param_names = ["log", "megabytes"]
+
+    def setup(self, log, megabytes):
+        self._directory = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._directory.name, "Synthetic.log")
+        if log == "tables":
+            generate_log(self.log_path, megabytes)
+        else:
+            generate_output_log(self.log_path, megabytes)
+
+        self.isolators = {name: config.table_ext for name, config in TableConfigs().table_types().items()}
+
+    def teardown(self, log, megabytes):
+        self._directory.cleanup()
+
+    def time_scanner(self, log, megabytes):
+        list(StataScanner(self.isolators).scan(self.log_path))
+
+    def time_stata_map(self, log, megabytes):
+        list(StataMap(self.isolators).scan(self.log_path))
+
+
+class TimeForest:
+    """Forest plot rows and in line methods of every table of a synthetic log, in a single batch"""
+    params = [1]
+    param_names = ["megabytes"]
+
+    def setup(self, megabytes):
+        self._directory = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._directory.name, "Synthetic.log")
+        generate_log(self.log_path, megabytes)
+
+        self.log = StataLog(self.log_path).load()
+        self.forest = self.log.forest_columns(["_cons"])
+
+    def teardown(self, megabytes):
+        self._directory.cleanup()
+
+    def time_forest_columns(self, megabytes):
+        self.log.forest_columns(["_cons"])
+
+    def time_write_methods(self, megabytes):
+        write_methods(self.forest, Path(self._directory.name, "methods.md"))
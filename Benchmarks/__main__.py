@@ -0,0 +1,70 @@
+"""
+Run the asv style benchmark suites, optionally only those whose name contains one of the arguments
+
+    python -m Benchmarks [TimeStages.time_scanner ...]
+"""
+from Benchmarks import ParseSuites
+
+from contextlib import redirect_stdout
+import itertools
+import inspect
+import timeit
+import sys
+import io
+
+
+SUITES = [ParseSuites]
+
+
+def run_suite(suite, filters, repeat=3):
+    """
+    Time each time_ method of an asv style suite for each of its params, reporting the best of repeat runs. As in asv,
+    params may be a list of lists, in which case every combination of them is run
+
+    :param suite: The suite class, with optional params, setup and teardown
+    :type suite: type
+
+    :param filters: Only run benchmarks whose name contains one of these, or every benchmark if empty
+    :type filters: list[str]
+
+    :param repeat: The number of times to time each benchmark, defaults to 3
+    :type repeat: int
+
+    :return: Nothing, prints the timings
+    :rtype: None
+    """
+    methods = [name for name in dir(suite) if name.startswith("time_")]
+    methods = [name for name in methods if len(filters) == 0 or any(f in f"{suite.__name__}.{name}" for f in filters)]
+    if len(methods) == 0:
+        return
+
+    params = getattr(suite, "params", [None])
+    if len(params) > 0 and all([isinstance(param, list) for param in params]):
+        combinations = [list(combination) for combination in itertools.product(*params)]
+    else:
+        combinations = [[] if param is None else [param] for param in params]
+
+    for args in combinations:
+        instance = suite()
+
+        # Configs warn when a field is missing from a table, which would otherwise flood the output
+        with redirect_stdout(io.StringIO()):
+            getattr(instance, "setup", lambda *_: None)(*args)
+        try:
+            for name in methods:
+                with redirect_stdout(io.StringIO()):
+                    best = min(timeit.repeat(lambda: getattr(instance, name)(*args), number=1, repeat=repeat))
+                print(f"{suite.__name__}.{name}({', '.join([str(arg) for arg in args])}): {best:.4f}s")
+        finally:
+            getattr(instance, "teardown", lambda *_: None)(*args)
+
+
+def main(filters):
+    for module in SUITES:
+        for _, suite in inspect.getmembers(module, inspect.isclass):
+            if suite.__module__ == module.__name__ and suite.__name__.startswith("Time"):
+                run_suite(suite, filters)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
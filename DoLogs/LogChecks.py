@@ -0,0 +1,49 @@
+"""
+Regression checks over the logs in DoLogs, for log layouts that have previously failed to parse
+
+    python -m DoLogs.LogChecks
+"""
+from stataLogObject import StataLog
+
+from pathlib import Path
+
+LOG_DIR = Path(__file__).parent
+
+
+def check_robust_binary():
+    """Robust and clustered probit / logit report a Wald chi2 and a log pseudolikelihood rather than the LR forms"""
+    log = StataLog(Path(LOG_DIR, "RobustBinaryLog.log"))
+    expected = {
+        "probit": {'obs': 50, 'lr_chi2': 5.19, 'chi2_prob': 0.0227, 'log_like': -19.568069, 'pseudo_r_sqr': 0.1698},
+        "logit": {'obs': 50, 'lr_chi2': 3.41, 'chi2_prob': 0.0648, 'log_like': -19.65997, 'pseudo_r_sqr': 0.1659}
+    }
+    for table_type, model_fit in expected.items():
+        tables = getattr(log, table_type)
+        assert len(tables) == 1, (table_type, len(tables))
+        table = tables[0]
+        assert table.model_fit == model_fit, (table_type, table.model_fit)
+        assert [entry.var_name for entry in table.body_values] == ["drate", "_cons"], table_type
+
+
+def check_tabulate_lengths():
+    """Tabulate tables of different lengths in one log each skip their own Total row, rather than that of the first"""
+    log = StataLog(Path(LOG_DIR, "TabulateLog.log"))
+
+    expected = [("region", 50, ["NE", "N_Cntrl", "South", "West"]), ("north", 50, ["0", "2"]),
+                ("region", 41, ["N_Cntrl", "South", "West"])]
+    assert len(log.tabulate) == len(expected), len(log.tabulate)
+    for table, (phenotype, total, var_names) in zip(log.tabulate, expected):
+        assert table.phenotype == phenotype, table.phenotype
+        assert table.model_fit == {"total": total}, table.model_fit
+        assert [entry.var_name for entry in table.body_values] == var_names, table.body_values
+
+
+def main():
+    checks = [check_robust_binary, check_tabulate_lengths]
+    for check in checks:
+        check()
+        print(f"ok {check.__name__}")
+
+
+if __name__ == '__main__':
+    main()
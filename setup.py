@@ -19,9 +19,15 @@ PYTHON_REQUIRES = ">=3.7"
 
 INSTALL_REQUIRES = [
     'miscSupports',
-    'csvObject'
+    'csvObject',
+    'numpy'
 ]
 
+EXTRAS_REQUIRE = {
+    'arrow': ['pyarrow'],
+    'zstd': ['zstandard']
+}
+
 CLASSIFIERS = [
     'Programming Language :: Python :: 3.7',
     'License :: OSI Approved :: MIT License',
@@ -50,7 +56,8 @@ if __name__ == "__main__":
         download_url=DOWNLOAD_URL,
         python_requires=PYTHON_REQUIRES,
         install_requires=INSTALL_REQUIRES,
+        extras_require=EXTRAS_REQUIRE,
         include_package_data=True,
-        packages=find_packages(),
+        packages=find_packages(exclude=["Benchmarks", "Benchmarks.*"]),
         classifiers=CLASSIFIERS
     )
@@ -1,10 +1,11 @@
 from stataLogObject.Configs import *
+from stataLogObject.Supports import TableTypeRegistered
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from abc import ABC
 
 
-@dataclass
+@dataclass(frozen=True)
 class Table(ABC):
     mf: MF
     table_ext: ExtractTable
@@ -46,6 +47,15 @@ class TableConfigs:
 
     )
 
+    re_gls: Table = Table(
+        PanelREMF(MFVar('Number of obs =', var_type=int), MFVar('Number of groups =', var_type=int),
+                  MFVar('min =', int, key_extract=1), MFVar('avg =', key_extract=1), MFVar('max =', int, key_extract=1),
+                  MFVar("Wald chi2("), MFVar('Prob > chi2 =', key_extract=2), MFVar('within ='), MFVar('between ='),
+                  MFVar('overall ='), MFVar('sigma_u |'), MFVar('sigma_e |'), MFVar('rho |')),
+        ExtractTable(['Random-effects', 'GLS', 'regression', 'Number', 'of', 'obs', '='], 3, [7]),
+        ExtractBody(ZScore())
+    )
+
     # TODO: Need to create an optional bool within VarField and create a new method type called GroupVar to handle the
     #   multiple (and potentially absent) group variable definitions
     mixed: Table = Table(
@@ -57,6 +67,20 @@ class TableConfigs:
 
     )
 
+    probit: Table = Table(
+        LogisticMF(MFVar('Number of obs =', var_type=int), MFVar('chi2('), MFVar('Prob > chi2 =', key_extract=1),
+                   MFVar('likelihood ='), MFVar('Pseudo R2 =', key_extract=2)),
+        ExtractTable(['Probit', 'regression', 'Number', 'of', 'obs', '='], 1, [6]),
+        ExtractBody(ZScore())
+    )
+
+    logit: Table = Table(
+        LogisticMF(MFVar('Number of obs =', var_type=int), MFVar('chi2('), MFVar('Prob > chi2 =', key_extract=1),
+                   MFVar('likelihood ='), MFVar('Pseudo R2 =', key_extract=2)),
+        ExtractTable(['Logistic', 'regression', 'Number', 'of', 'obs', '='], 1, [6]),
+        ExtractBody(ZScore())
+    )
+
     summary: Table = Table(
         MF(),
         ExtractTable(['Variable', '|', 'Obs', 'Mean', 'Std.', 'Dev.', 'Min', 'Max'], 0),
@@ -68,3 +92,81 @@ class TableConfigs:
         ExtractTable(['|', 'Freq.', 'Percent', 'Cum.'], 0, [0]),
         ExtractBody(Tabulate(), 0, [-1])
     )
+
+    def __post_init__(self):
+        """Take the table types registered via register_table when this configuration is created"""
+        self._registered = dict(_REGISTERED_TABLES)
+
+    def register(self, name, table, replace=False):
+        """
+        Register a table type with this configuration only, see register_table
+
+        :return: Nothing, adds the table type to this configuration
+        :rtype: None
+        """
+        if _reserved_name(name):
+            raise TableTypeRegistered(name, reserved=True)
+        if not replace and name in self.table_types():
+            raise TableTypeRegistered(name)
+        self._registered[name] = table
+
+    def table_types(self):
+        """Returns each table type name alongside its Table configuration, followed by any registered table types"""
+        return {**{f.name: getattr(self, f.name) for f in fields(self)}, **self._registered}
+
+
+def _reserved_name(name):
+    """
+    True if name is private or an attribute of StataLog, such as index or find, which would shadow the tables of a table
+    type of that name. The built in table types are themselves StataLog properties, so they can still be replaced.
+
+    :param name: The table type name
+    :type name: str
+
+    :return: If name cannot be used as a table type name
+    :rtype: bool
+    """
+    # Imported here, as StataLog itself imports the configurations
+    from stataLogObject.StataParser.StataLog import StataLog
+
+    built_in = [f.name for f in fields(TableConfigs)]
+    attributes = [attribute for attribute in dir(StataLog) if attribute not in built_in]
+    return name.startswith("_") or name in StataLog.INSTANCE_ATTRIBUTES or name in attributes
+
+
+# Table types registered by user code, which are added to every TableConfigs created after registration
+_REGISTERED_TABLES = {}
+
+
+def register_table(name, table, replace=False):
+    """
+    Register a table type, so it is isolated alongside the built in table types by every TableConfigs created after
+    this point. The divider of the table type is added to the same single pass of the log, so registering further
+    table types does not add another pass.
+
+    :param name: The table type name, which is also how its tables are accessed from a StataLog
+    :type name: str
+
+    :param table: The configuration of the table type
+    :type table: Table
+
+    :param replace: If True, replace a table type of the same name, including a built in table type. Otherwise raise
+        TableTypeRegistered. Defaults to False
+    :type replace: bool
+
+    :return: Nothing, adds the table type to the registry
+    :rtype: None
+
+    :raises TableTypeRegistered: If name is already registered and replace is False, or if name is an attribute of
+        StataLog, such as index or find, regardless of replace
+    """
+    if _reserved_name(name):
+        raise TableTypeRegistered(name, reserved=True)
+    if not replace and (name in _REGISTERED_TABLES or name in [f.name for f in fields(TableConfigs)]):
+        raise TableTypeRegistered(name)
+    _REGISTERED_TABLES[name] = table
+
+
+def unregister_table(name):
+    """Remove a table type registered via register_table"""
+    _REGISTERED_TABLES.pop(name)
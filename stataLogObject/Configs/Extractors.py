@@ -1,32 +1,43 @@
-from stataLogObject.Supports import clean_value
+from stataLogObject.Supports import clean_column, EntryLengthInvalid
 from stataLogObject.Configs import Entry
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Tuple
+import numpy as np
+import time
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExtractTable:
     """
     | Contains the information needed for extraction
     |
     | *Attributes*:
-    |    **divider (list)**: The divider to isolate the elements
+    |    **divider (tuple)**: The divider to isolate the elements
     |    **separator (int)**: The number of spaces allowed before the table is considered finished and is saved
-    |    **skip_indexes** (Optional[list]):  Option list of elements found in the log needs to have certain elements
+    |    **skip_indexes** (Optional[tuple]):  Option tuple of elements found in the log needs to have certain elements
     |   skipped
 
+    Lists may be given for divider and skip_indexes, which are stored as tuples so the configuration is read only
     """
-    divider: List
+    divider: Tuple[str, ...]
     separator: int
-    skip_indexes: List = field(default_factory=lambda: [])
+    skip_indexes: Tuple[int, ...] = ()
 
+    def __post_init__(self):
+        object.__setattr__(self, "divider", tuple(self.divider))
+        object.__setattr__(self, "skip_indexes", tuple(self.skip_indexes))
 
-@dataclass
+
+@dataclass(frozen=True)
 class ExtractBody:
-    body_type: Entry
+    # Entries compare by value so are not hashable, but the entry type is fixed by the table type so is not needed
+    body_type: Entry = field(hash=False)
     skip_lines: int = 0
-    skip_indexes: List = field(default_factory=lambda: [])
+    skip_indexes: Tuple[int, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "skip_indexes", tuple(self.skip_indexes))
 
     def extract_body(self, raw):
         """
@@ -37,23 +48,47 @@ class ExtractBody:
         :return: A str of the phenotype and a list of TableEntry
         :rtype: (str, list[TableEntry])
         """
-        self._format_indexes(len(raw))
+        phenotype, columns = self.extract_columns(raw)
+        rows = zip(*[column.tolist() for column in columns.values()])
+        return phenotype, [self.body_type.create_entry(list(row)) for row in rows]
+
+    def extract_columns(self, raw, stats=None, table_type=None):
+        """
+        This extracts the body of the table in the same way as extract_body, but returns it in columnar form without
+        creating an Entry for each row. The var_name column is a string array, and every other column is parsed in
+        bulk to a float64 array.
+
+        :param raw: The raw table
+        :type raw: list[list[str]]
 
-        # Isolate results with tables based on table line delimiters, skip indexes in the skip_indexes if provided
-        result_indexes = [i for i, line in enumerate(raw) if ("|" in line) and (i not in self.skip_indexes)]
+        :param stats: If set, the time spent extracting the body is recorded to it, defaults to None
+        :type stats: stataLogObject.Supports.ParseStats | None
 
-        # Isolate these lines without the table line elements
-        body_lines = self._extract_body_lines(raw, result_indexes)
+        :param table_type: The table type name to record stats against, defaults to None
+        :type table_type: str | None
+
+        :return: A str of the phenotype and a dict of entry name: column
+        :rtype: (str, dict[str, np.ndarray])
+        """
+        start = time.perf_counter() if stats is not None else None
+
+        # Isolate the lines of the table body without the table line elements, skipping any skip_indexes
+        body_lines = self._extract_body_lines(raw, self._format_indexes(len(raw)))
 
         # # Extract the variable names, with the first one always being the phenotype/outcome
         phenotype = body_lines[0][0]
 
-        # Return the phenotype, variable names, and the table bodies formatted values
-        return phenotype, self._create_table_entries(body_lines)
+        # Return the phenotype, and the table bodies formatted values as columns
+        columns = self._create_table_columns(body_lines)
+        if stats is not None:
+            stats.record("body", table_type, start, len(body_lines))
+        return phenotype, columns
 
     def _format_indexes(self, table_length):
         """
-        We may need to subtract indexes from the bottom, in which case the index is relative to the table length
+        We may need to subtract indexes from the bottom, in which case the index is relative to the table length. These
+        are formatted for each table rather than stored, as the length of each table may differ and the configuration
+        is shared.
 
         Note
         ----
@@ -61,57 +96,90 @@ class ExtractBody:
         negative skip indexes are formatted in the same way as indexing, so -1 retrieves the last element. However, if
             we take the index of -1 from the table length then we always skip the second to last element. We can't use
             zero, as zero is an actual index for the first element. As such, each negative value gets +1 added to it.
+
+        :param table_length: The number of lines in the raw table
+        :type table_length: int
+
+        :return: The indexes of the raw table to skip
+        :rtype: set[int]
         """
-        self.skip_indexes = [v if v >= 0 else (table_length - 1) + (v + 1) for v in self.skip_indexes]
+        return {v if v >= 0 else (table_length - 1) + (v + 1) for v in self.skip_indexes}
 
-    def _extract_body_lines(self, raw, result_indexes):
+    def _extract_body_lines(self, raw, skip_indexes):
         """
         This will strip out the lines without the table line elements.
 
-        :param result_indexes: The indexes of the results table
-        :type result_indexes: list[int]
+        Note
+        ----
+        Result lines are those with a table line delimiter that are not in skip_indexes. The body starts skip_lines
+        lines after the first result line, so this is found in the same single pass that collects the body.
+
+        :param skip_indexes: The indexes of raw that are not results, already formatted relative to the table length
+        :type skip_indexes: set[int]
 
         :return: A list of each row that is in the table body
         :rtype: list[list[str]]
         """
+        body_start = None
         body_lines = []
         for index, line in enumerate(raw):
-            # TODO: This feels like a very strange if statement...
-            if min(result_indexes) + self.skip_lines <= index and index in result_indexes:
-
-                # Not all regression types will be without blanks, so this only adds rows that where the value is more
-                # than just he name of the variable
-                values_stripped = [value for value in line if value != "|"]
-                if len(values_stripped) > 1:
-                    body_lines.append(values_stripped)
-
-                    # Most tables end with _cons so we can stop after this point
-                    if values_stripped[0] == "_cons":
-                        break
+            if "|" not in line or index in skip_indexes:
+                continue
+
+            # The first result line sets where the body starts
+            if body_start is None:
+                body_start = index + self.skip_lines
+            if index < body_start:
+                continue
+
+            # Not all regression types will be without blanks, so this only adds rows that where the value is more
+            # than just he name of the variable
+            values_stripped = [value for value in line if value != "|"]
+            if len(values_stripped) > 1:
+                body_lines.append(values_stripped)
+
+                # Most tables end with _cons so we can stop after this point
+                if values_stripped[0] == "_cons":
+                    break
         return body_lines
 
-    def _create_table_entries(self, body_lines):
-        """Clean the values which are not the table header, create Entry of type Body_Type for each line accordingly"""
-        return [self.body_type.create_entry(line) for line in self._limit_var_names(body_lines)]
+    def _create_table_columns(self, body_lines):
+        """
+        Transpose the lines which are not the table header into columns, with each numeric column cleaned in bulk
+
+        :param body_lines: Each line from the body that is a variable result
+        :type body_lines: list[list[str]]
+
+        :return: A dict of entry name: column
+        :rtype: dict[str, np.ndarray]
+        """
+        entry_names = self.body_type.entry_names
+        lines = self._limit_var_names(body_lines)
+        for line in lines:
+            if len(line) != len(entry_names):
+                raise EntryLengthInvalid(entry_names, line)
+
+        columns = list(zip(*lines)) if len(lines) > 0 else [() for _ in entry_names]
+        return {name: np.array(column, dtype=str) if i == 0 else clean_column(column)
+                for i, (name, column) in enumerate(zip(entry_names, columns))}
 
     def _limit_var_names(self, body_lines):
         """
-        Extract the values then format them
+        Format the values relative to the table headers
 
         Note
         ----
-        After extracting the values, it is possible that space seperated names may lead to more elements in a row than
-        there are columns to accept them. Here after extracting the values, we format them relative to the length of
-        table headers
+        It is possible that space seperated names may lead to more elements in a row than there are columns to accept
+        them. Here we format them relative to the length of table headers
 
         :param body_lines: Each line from the body that is a variable result
         :type body_lines: list[list[str]]
 
         :return: Formatted lines
-        :rtype: list[list]
+        :rtype: list[list[str]]
         """
-        lines = [[clean_value(value) for value in line] for line in body_lines[1:]]
-        return [line if len(line) == len(self.body_type.entry_names) else self._line_format(line) for line in lines]
+        return [line if len(line) == len(self.body_type.entry_names) else self._line_format(line)
+                for line in body_lines[1:]]
 
     def _line_format(self, line):
         """Format line relative to the number of table headers"""
@@ -3,18 +3,117 @@ from stataLogObject.Configs.ModelVars import MFVar, REVar, GroupVar
 from dataclasses import dataclass, fields
 from typing import Optional
 from abc import ABC
+import re
 
 
-@dataclass
+@dataclass(frozen=True)
 class MF(ABC):
-    """Model Fit base class"""
+    """
+    Model Fit base class
+
+    Note
+    ----
+    Model fit configurations are frozen, so the MFExtractor compiled from them can never be out of date with their
+    fields. Sub classes must therefore also be declared with @dataclass(frozen=True).
+    """
 
     def field_names(self):
         """Returns the summary information"""
         return [f.name for f in fields(self)]
 
+    def __post_init__(self):
+        """Compile the MFExtractor once, when the configuration is created, so it is never built during a parse"""
+        object.__setattr__(self, "_extractor", MFExtractor(self))
+
+    def compile(self):
+        """Returns the MFExtractor compiled for this model fit"""
+        return self._extractor
+
+
+class MFExtractor:
+    __slots__ = ("_mf_name", "_fields", "_extractors", "_pattern")
+
+    def __init__(self, mf):
+        """
+        Extracts every model fit parameter of a MF configuration in a single pass over the raw table.
+
+        A single alternation pattern of every extractor string is used to reject the lines that contain none of them,
+        so each line is only joined and searched once. Lines that do match are then checked for the extractors not yet
+        found, and the first line index of each extractor is used to extract the parameters in field order.
+
+        Note
+        ----
+        The fields and extractors are captured as tuples on creation and nothing is assigned afterwards, with all the
+        state of an extraction held within the call, so a single MFExtractor can be shared by many threads.
+
+        :param mf: The model fit configuration
+        :type mf: MF
+        """
+        self._mf_name = type(mf).__name__
+        self._fields = tuple([(f, getattr(mf, f)) for f in mf.field_names()])
+        self._extractors = tuple(dict.fromkeys([var.extractor for _, var in self._fields if var]))
+
+        self._pattern = re.compile("|".join([re.escape(extractor) for extractor in self._extractors]))
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"MFExtractor for {self._mf_name}"
+
+    def _find_lines(self, lines_list):
+        """
+        Find the index of the first line that contains each extractor
+
+        :param lines_list: The raw table
+        :type lines_list: list[list[str]]
+
+        :return: A dict of extractor: line index, for each extractor that was found
+        :rtype: dict[str, int]
+        """
+        remaining = list(self._extractors)
+        found = {}
+        for i, line in enumerate(lines_list):
+            if len(remaining) == 0:
+                break
+
+            joined = " ".join(line)
+            if self._pattern.search(joined):
+                for extractor in [extractor for extractor in remaining if extractor in joined]:
+                    found[extractor] = i
+                    remaining.remove(extractor)
+        return found
+
+    def extract(self, lines_list):
+        """
+        Extract every model fit parameter from the raw table
+
+        Note
+        ----
+        The group table of a GroupVar is blanked out of the raw table on extraction, so lines_list should be a copy
+        owned by the caller. If this removes a line that a later field was found on, then that field falls back to
+        searching the raw table itself so the result is the same as searching for each field in turn.
+
+        :param lines_list: The raw table, which may have lines blanked
+        :type lines_list: list[list[str]]
+
+        :return: A dict of field name: value, where the value is None if the optional field was not configured
+        :rtype: dict
+        """
+        found = self._find_lines(lines_list)
+
+        model_fit = {}
+        for f, var in self._fields:
+            if not var:
+                model_fit[f] = None
+            elif var.extractor not in found:
+                model_fit[f] = var.not_found(f)
+            elif var.extractor not in " ".join(lines_list[found[var.extractor]]):
+                model_fit[f] = var.find_mf(lines_list, f)
+            else:
+                model_fit[f] = var.extract_mf(found[var.extractor], lines_list, f)
+        return model_fit
+
 
-@dataclass
+@dataclass(frozen=True)
 class LinearMF(MF):
     """Linear Regression model fit parameters"""
     obs: MFVar
@@ -27,12 +126,12 @@ class LinearMF(MF):
     within_r_sqr: Optional[MFVar] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class TabMF(MF):
     total: MFVar
 
 
-@dataclass
+@dataclass(frozen=True)
 class PanelMF(MF):
     obs: MFVar
     groups: MFVar
@@ -49,7 +148,7 @@ class PanelMF(MF):
     rho: MFVar
 
 
-@dataclass
+@dataclass(frozen=True)
 class MixedMF(MF):
     obs: MFVar
     wald: MFVar
@@ -62,8 +161,36 @@ class MixedMF(MF):
     re_params: REVar
 
 
-# TODO
-@dataclass
+@dataclass(frozen=True)
+class PanelREMF(MF):
+    """Random effects panel regression model fit parameters"""
+    obs: MFVar
+    groups: MFVar
+    obs_group_min: MFVar
+    obs_group_avg: MFVar
+    obs_group_max: MFVar
+    wald: MFVar
+    chi2_prob: MFVar
+    r_sqr_within: MFVar
+    r_sqr_between: MFVar
+    r_sqr_overall: MFVar
+    sigma_u: MFVar
+    sigma_e: MFVar
+    rho: MFVar
+
+
+@dataclass(frozen=True)
 class LogisticMF(MF):
-    """Logistical Regression model fit parameters"""
-    pass
+    """
+    Logistical Regression model fit parameters, shared by logit and probit
+
+    Note
+    ----
+    With robust or clustered standard errors Stata reports a Wald chi2 and a log pseudolikelihood in place of the LR
+    chi2 and the log likelihood, so lr_chi2 and log_like hold whichever of the two forms the log contains.
+    """
+    obs: MFVar
+    lr_chi2: MFVar
+    chi2_prob: MFVar
+    log_like: MFVar
+    pseudo_r_sqr: MFVar
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from abc import abstractmethod
 
 
-@dataclass
+@dataclass(frozen=True)
 class VarField:
     extractor: str
     var_type: type = float
@@ -16,7 +16,14 @@ class VarField:
         for i, line in enumerate(lines_list):
             if self.extractor in " ".join(line):
                 return self._extract_mf(i, lines_list, var_name)
+        return self.not_found(var_name)
 
+    def extract_mf(self, index, lines_list, var_name):
+        """Extract the model fit parameter from the raw table, where the extractor is known to be on line index"""
+        return self._extract_mf(index, lines_list, var_name)
+
+    def not_found(self, var_name):
+        """The extractor was not found in the lines list, which is only valid if this variable is optional"""
         if not self.optional:
             raise InvalidKeyExtract(self.extractor, var_name)
         else:
@@ -31,7 +38,7 @@ class VarField:
         """Extract the variable(s) from the list of values for a given variable"""
 
 
-@dataclass
+@dataclass(frozen=True)
 class MFVar(VarField):
     """Extracting information for a given model fit variable"""
     key_extract: int = 0
@@ -52,7 +59,7 @@ class MFVar(VarField):
             raise HeaderKeyExtractError(self.key_extract, values_list, var_name)
 
 
-@dataclass
+@dataclass(frozen=True)
 class REVar(VarField):
     """Random effects parameters"""
 
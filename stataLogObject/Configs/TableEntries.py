@@ -1,11 +1,47 @@
 from stataLogObject.Supports import EntryLengthInvalid
 
-from dataclasses import dataclass, fields
 from abc import ABC, abstractmethod
 
 
-@dataclass
 class Entry(ABC):
+    """
+    A row of a table body
+
+    Note
+    ----
+    Sub classes declare their fields in __slots__, so each row has no instance __dict__. The field names are cached once
+    per class when it is created, and every field defaults to None.
+    """
+    __slots__ = ()
+    _entry_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._entry_names = tuple([n for base in reversed(cls.__mro__) for n in base.__dict__.get("__slots__", ())])
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self._entry_names):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self._entry_names)} values but got {len(args)}")
+
+        values = dict(zip(self._entry_names, args))
+        for name, value in kwargs.items():
+            if name not in self._entry_names or name in values:
+                raise TypeError(f"{type(self).__name__} got an unexpected or repeated value for '{name}'")
+            values[name] = value
+
+        for name in self._entry_names:
+            setattr(self, name, values.get(name))
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"{type(self).__name__}({', '.join([f'{n}={getattr(self, n)!r}' for n in self._entry_names])})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all([getattr(self, n) == getattr(other, n) for n in self._entry_names])
+
+    __hash__ = None
 
     @abstractmethod
     def entry_type(self):
@@ -14,62 +50,40 @@ class Entry(ABC):
     @property
     def entry_names(self):
         """Names of each field"""
-        return [f.name for f in fields(self)]
+        return list(self._entry_names)
 
     @property
     def entry_values(self):
         """Get all the values associated with this entry"""
-        return {f.name: getattr(self, f.name) for f in fields(self)}
+        return {n: getattr(self, n) for n in self._entry_names}
 
     def create_entry(self, value_list):
         """Create the given entry with the values initialised to the value_list"""
-        entry = self.entry_type()()
-        if len(value_list) != len(entry.entry_names):
-            raise EntryLengthInvalid(entry.entry_names, value_list)
+        if len(value_list) != len(self._entry_names):
+            raise EntryLengthInvalid(self.entry_names, value_list)
 
-        [setattr(entry, n, v) for n, v in zip(entry.entry_names, value_list)]
-        return entry
+        return self.entry_type()(*value_list)
 
 
-@dataclass
 class ZScore(Entry):
     """Z score variant of TableEntry"""
-    var_name: str = None
-    coefficient: float = None
-    std_err: float = None
-    z_score: float = None
-    prob: float = None
-    lb_95: float = None
-    ub_95: float = None
+    __slots__ = ("var_name", "coefficient", "std_err", "z_score", "prob", "lb_95", "ub_95")
 
     def entry_type(self):
         return ZScore
 
 
-@dataclass
 class PValue(Entry):
     """P value variant of Table Entry"""
-    var_name: str = None
-    coefficient: float = None
-    std_err: float = None
-    p_value: float = None
-    prob: float = None
-    lb_95: float = None
-    ub_95: float = None
+    __slots__ = ("var_name", "coefficient", "std_err", "p_value", "prob", "lb_95", "ub_95")
 
     def entry_type(self):
         return PValue
 
 
-@dataclass
 class Summary(Entry):
     """Summary table variant of Table Entry"""
-    var_name: str = None
-    obs: int = None
-    mean: float = None
-    std_dev: float = None
-    v_min: float = None
-    v_max: float = None
+    __slots__ = ("var_name", "obs", "mean", "std_dev", "v_min", "v_max")
 
     def entry_type(self):
         return Summary
@@ -79,13 +93,9 @@ class Summary(Entry):
         return [self.mean - self.std_dev, self.mean + self.std_dev]
 
 
-@dataclass
 class Tabulate(Entry):
     """Tabulate table variant of Table Entry"""
-    var_name: str = None
-    freq: int = None
-    percent: float = None
-    cumulative: float = None
+    __slots__ = ("var_name", "freq", "percent", "cumulative")
 
     def entry_type(self):
         return Tabulate
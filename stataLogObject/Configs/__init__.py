@@ -1,4 +1,4 @@
-from .ModelFit import MFVar, MF, LinearMF, TabMF, PanelMF, MixedMF, REVar, GroupVar
+from .ModelFit import MFVar, MF, LinearMF, TabMF, PanelMF, PanelREMF, MixedMF, LogisticMF, REVar, GroupVar
 from .TableEntries import ZScore, PValue, Summary, Entry, Tabulate
 from .Extractors import ExtractBody, ExtractTable
-from .ConfigObj import Table, TableConfigs
+from .ConfigObj import Table, TableConfigs, register_table, unregister_table
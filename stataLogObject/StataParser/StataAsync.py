@@ -0,0 +1,102 @@
+from stataLogObject.StataParser.StataLog import StataLog
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import threading
+import asyncio
+
+
+def _load_log(log_path, memory_map):
+    """Parse every table type of a log, as a module level function so it can be sent to a process pool"""
+    return StataLog(log_path, memory_map=memory_map).load()
+
+
+async def parse_log_async(log_path, executor=None, memory_map=False):
+    """
+    Parse a log in an executor, so the event loop is not blocked while the log is read and parsed
+
+    :param log_path: The path to the log file
+    :type log_path: str | Path
+
+    :param executor: The executor to parse in. Defaults to None, which uses the default executor of the event loop. A
+        ProcessPoolExecutor may be given so parsing does not compete with the event loop for the GIL
+    :type executor: concurrent.futures.Executor | None
+
+    :param memory_map: Passed to the StataLog, defaults to False
+    :type memory_map: bool
+
+    :return: The parsed log
+    :rtype: StataLog
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, _load_log, Path(log_path), memory_map)
+
+
+async def aiter_tables(log_paths, concurrency=4, max_pending=256, memory_map=False):
+    """
+    Parse many logs in a thread pool, yielding each table as soon as it is complete
+
+    Note
+    ----
+    At most concurrency logs are parsed at once. Tables are passed back through a queue of at most max_pending tables,
+    and a worker blocks once the queue is full, so a slow consumer holds back parsing rather than tables accumulating
+    in memory. If the consumer stops early, the remaining logs are not parsed. An error parsing a log is raised when it
+    is reached in the stream.
+
+    :param log_paths: The paths to the log files
+    :type log_paths: list[str | Path]
+
+    :param concurrency: The maximum number of logs to parse at once, defaults to 4
+    :type concurrency: int
+
+    :param max_pending: The maximum number of parsed tables waiting to be consumed, defaults to 256
+    :type max_pending: int
+
+    :param memory_map: Passed to each StataLog, defaults to False
+    :type memory_map: bool
+
+    :return: An async generator of the log path and StataTable, in the order tables were completed
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(max_pending)
+    semaphore = asyncio.Semaphore(concurrency)
+    closed = threading.Event()
+    finished = object()
+
+    def produce(log_path):
+        """Stream the tables of a log onto the queue, waiting for space whenever it is full"""
+        try:
+            for table in StataLog(log_path, memory_map=memory_map).iter_tables():
+                if closed.is_set():
+                    return
+                asyncio.run_coroutine_threadsafe(queue.put((log_path, table)), loop).result()
+        except Exception as e:
+            if not closed.is_set():
+                asyncio.run_coroutine_threadsafe(queue.put((log_path, e)), loop).result()
+
+    async def run(log_path, executor):
+        async with semaphore:
+            if not closed.is_set():
+                await loop.run_in_executor(executor, produce, log_path)
+        await queue.put((log_path, finished))
+
+    log_paths = [Path(path) for path in log_paths]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        tasks = [asyncio.ensure_future(run(path, executor)) for path in log_paths]
+        try:
+            remaining = len(tasks)
+            while remaining > 0:
+                log_path, item = await queue.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield log_path, item
+
+        finally:
+            # Stop any remaining work, emptying the queue so that no worker is left waiting for space
+            closed.set()
+            while not all([task.done() for task in tasks]):
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.wait(tasks, timeout=0.01)
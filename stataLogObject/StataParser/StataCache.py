@@ -0,0 +1,137 @@
+from stataLogObject.StataParser.StataLog import StataLog
+from stataLogObject.Configs import TableConfigs
+from stataLogObject.Supports import open_log, log_stat
+from stataLogObject import __version__
+
+from pathlib import Path
+import tempfile
+import hashlib
+import pickle
+import os
+
+
+class StataCache:
+    def __init__(self, cache_directory=None, max_bytes=512 * 1024 * 1024):
+        """
+        An on disk cache of parsed logs, so unchanged logs do not need to be parsed again
+
+        Note
+        ----
+        Each entry is keyed by the size, modification time and content hash of the log alongside the package version
+        and a hash of the TableConfigs in use when the log is loaded, so any change to the log, to the package, or to
+        the configurations, including table types registered after the cache was created, is a cache miss. Entries are
+        prefixed by a hash of the log path, so the entries of a given log can be invalidated. Once the cache is larger
+        than max_bytes, the least recently used entries are removed.
+
+        :param cache_directory: The directory to store the cache in, defaults to ~/.cache/stataLogObject
+        :type cache_directory: str | Path | None
+
+        :param max_bytes: The maximum size of the cache in bytes, defaults to 512MB
+        :type max_bytes: int
+        """
+        if cache_directory is None:
+            cache_directory = Path(Path.home(), ".cache", "stataLogObject")
+        self.cache_directory = Path(cache_directory)
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataCache at {self.cache_directory} with {len(self._entries())} entries"
+
+    def load(self, log_path, memory_map=False):
+        """
+        Load a parsed log from the cache, or parse and store it if it is not present
+
+        :param log_path: The path to the log file
+        :type log_path: str | Path
+
+        :param memory_map: Passed to the StataLog on a cache miss, defaults to False
+        :type memory_map: bool
+
+        :return: The parsed log
+        :rtype: StataLog
+        """
+        log_path = Path(log_path)
+        entry_path = Path(self.cache_directory, f"{self._path_hash(log_path)}_{self._log_hash(log_path)}.pickle")
+
+        if entry_path.exists():
+            try:
+                with open(entry_path, "rb") as entry:
+                    log = pickle.load(entry)
+                os.utime(entry_path)
+                return log
+
+            # A corrupted entry is treated as a cache miss
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                entry_path.unlink()
+
+        log = StataLog(log_path, memory_map=memory_map).load()
+        self._store(log, entry_path)
+        return log
+
+    def invalidate(self, log_path=None):
+        """
+        Remove entries from the cache
+
+        :param log_path: If set, only the entries of this log are removed. Otherwise the whole cache is cleared
+        :type log_path: str | Path | None
+
+        :return: Nothing, removes the entries from the cache directory
+        :rtype: None
+        """
+        prefix = "" if log_path is None else f"{self._path_hash(Path(log_path))}_"
+        for entry_path in self._entries():
+            if entry_path.name.startswith(prefix):
+                entry_path.unlink()
+
+    def _store(self, log, entry_path):
+        """
+        Write a parsed log to the cache, replacing any older entries of this log, then evict entries if required
+
+        Note
+        ----
+        The entry is written to a temporary file and then renamed so concurrent readers never see a partial entry
+        """
+        self.invalidate(log.log_path)
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as entry:
+            pickle.dump(log, entry, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, entry_path)
+
+        self._evict()
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache is no larger than max_bytes"""
+        entries = sorted([(entry.stat(), entry) for entry in self._entries()], key=lambda entry: entry[0].st_mtime)
+
+        cache_size = sum([stat.st_size for stat, _ in entries])
+        for stat, entry_path in entries:
+            if cache_size <= self.max_bytes:
+                break
+            entry_path.unlink()
+            cache_size -= stat.st_size
+
+    def _entries(self):
+        """The paths of each entry in the cache"""
+        return list(self.cache_directory.glob("*.pickle"))
+
+    @staticmethod
+    def _path_hash(log_path):
+        """Hash of the resolved log path"""
+        return hashlib.sha1(str(log_path.resolve()).encode()).hexdigest()
+
+    def _log_hash(self, log_path, chunk_size=1 << 20):
+        """Hash of the size, modification time and content of the log, the package version and the configurations"""
+        content = hashlib.sha256()
+        with open_log(log_path) as log_file:
+            for chunk in iter(lambda: log_file.read(chunk_size), b""):
+                content.update(chunk)
+
+        # Hashed on each load, as table types may have been registered or unregistered since the cache was created
+        config_hash = hashlib.sha256(repr(TableConfigs().table_types()).encode()).hexdigest()
+
+        stat = log_stat(log_path)
+        key = f"{stat.st_size}_{stat.st_mtime_ns}_{content.hexdigest()}_{__version__}_{config_hash}"
+        return hashlib.sha256(key.encode()).hexdigest()
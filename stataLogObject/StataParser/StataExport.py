@@ -0,0 +1,248 @@
+from stataLogObject.Supports import ForestPlotInvalidAttributes, FOREST_DICT, methods_in_line
+
+from pathlib import Path
+import numpy as np
+
+
+def stack_columns(logs):
+    """
+    Stack every table of one or more logs into a single set of columns
+
+    Note
+    ----
+    Each table contributes one row per variable in its body. Table level values, such as the table type, phenotype,
+    table ordinal within its table type, and each model fit parameter prefixed by mf_, are repeated for each row. Body
+    and model fit columns that a table does not have are filled with missing values. Columns are built by concatenating
+    the existing column arrays, so no per-row Python objects are created.
+
+    :param logs: The log path, and a dict of table type name: list of StataTable, for each log
+    :type logs: list[(Path, dict[str, list[stataLogObject.StataParser.StataTable]])]
+
+    :return: A dict of column name: array
+    :rtype: dict[str, np.ndarray]
+    """
+    tables = [(log_path, table_type, ordinal, table) for log_path, table_types in logs
+              for table_type, type_tables in table_types.items() for ordinal, table in enumerate(type_tables)]
+    if len(tables) == 0:
+        return {name: np.array([], dtype=object) for name in ["log", "table_type", "table_ordinal", "phenotype"]}
+
+    lengths = np.array([len(table.table_columns["var_name"]) for _, _, _, table in tables], dtype=np.int64)
+
+    columns = {
+        "log": np.repeat(np.array([str(log_path) for log_path, _, _, _ in tables], dtype=object), lengths),
+        "table_type": np.repeat(np.array([table_type for _, table_type, _, _ in tables], dtype=object), lengths),
+        "table_ordinal": np.repeat(np.array([ordinal for _, _, ordinal, _ in tables], dtype=np.int64), lengths),
+        "phenotype": np.repeat(np.array([table.phenotype for _, _, _, table in tables], dtype=object), lengths)
+    }
+
+    body_names = list(dict.fromkeys([n for _, _, _, table in tables for n in table.table_columns.keys()]))
+    for name in body_names:
+        present = np.array([name in table.table_columns for _, _, _, table in tables])
+        values = np.concatenate([table.table_columns[name] for _, _, _, table in tables if name in table.table_columns])
+        columns[name] = _fill_missing(values, np.repeat(present, lengths))
+
+    model_fit_names = list(dict.fromkeys([n for _, _, _, table in tables for n in table.model_fit.keys()]))
+    for name in model_fit_names:
+        present = np.array([name in table.model_fit for _, _, _, table in tables])
+        values = np.array([table.model_fit[name] for _, _, _, table in tables if name in table.model_fit], dtype=object)
+        columns[f"mf_{name}"] = np.repeat(_fill_missing(values, present), lengths)
+
+    return columns
+
+
+def _fill_missing(values, present):
+    """
+    Place values into a column where present is True, with the remaining rows being missing values
+
+    Note
+    ----
+    Columns are float64 where any value is numeric, with values that are not numeric, such as the N/A or . Stata
+    reports when a statistic cannot be computed, as missing values. A single such value in one table therefore does
+    not change the type of the column for every table. Columns without any numeric value, such as names, are
+    represented as strings with missing values as None.
+
+    :param values: The values of the rows that are present
+    :type values: np.ndarray
+
+    :param present: A bool mask of the rows of the column that have a value
+    :type present: np.ndarray
+
+    :return: The column, as float64 or an object array of str and None
+    :rtype: np.ndarray
+    """
+    if values.dtype == object:
+        if any([_is_number(value) for value in values.tolist()]):
+            values = _as_float(values)
+        else:
+            values = values.astype(str).astype(object)
+
+    if present.all():
+        return values
+
+    column = np.full(len(present), np.nan) if values.dtype == np.float64 else np.full(len(present), None, dtype=object)
+    column[present] = values
+    return column
+
+
+def stack_forest(logs, exclusions=None, table_types=None):
+    """
+    Stack the forest plot rows of every table of one or more logs into a single set of columns
+
+    Note
+    ----
+    Each table is given a table_id, in the same order as StataIndex, so a table_id can be looked up within the index of
+    the same logs. The var_name, coefficient, lb_95 and ub_95 columns of each table are concatenated once, and the
+    exclusions are then removed from every table at once via a single mask, rather than each table being transposed
+    and filtered on its own. Values that are not numeric are missing values in the float64 columns.
+
+    :param logs: The log path, and a dict of table type name: list of StataTable, for each log
+    :type logs: list[(Path, dict[str, list[stataLogObject.StataParser.StataTable]])]
+
+    :param exclusions: An optional list of var names to exclude from every table, such as _cons
+    :type exclusions: list[str] | None
+
+    :param table_types: The table types to include. Defaults to None, which includes every table whose body has the
+        forest plot columns. If set, every table of these types must have them.
+    :type table_types: list[str] | None
+
+    :return: A dict of column name: array, of table_id, log, table_type, table_ordinal, phenotype, var_name,
+        coefficient, lb_95 and ub_95
+    :rtype: dict[str, np.ndarray]
+
+    :raises ForestPlotInvalidAttributes: If a table of a requested table type lacks the forest plot columns
+    """
+    tables = [(log_path, table_type, ordinal, table) for log_path, log_types in logs
+              for table_type, type_tables in log_types.items() for ordinal, table in enumerate(type_tables)]
+
+    forest = []
+    for table_id, (log_path, table_type, ordinal, table) in enumerate(tables):
+        has_columns = all([name in table.table_columns for name in FOREST_DICT.keys()])
+        if table_types is None and has_columns:
+            forest.append((table_id, log_path, table_type, ordinal, table))
+        elif table_types is not None and table_type in table_types:
+            if not has_columns:
+                raise ForestPlotInvalidAttributes(list(table.table_columns.keys()), FOREST_DICT.keys())
+            forest.append((table_id, log_path, table_type, ordinal, table))
+
+    lengths = np.array([len(table.table_columns["var_name"]) for *_, table in forest], dtype=np.int64)
+    columns = {
+        "table_id": np.repeat(np.array([table_id for table_id, *_ in forest], dtype=np.int64), lengths),
+        "log": np.repeat(np.array([str(log_path) for _, log_path, *_ in forest], dtype=object), lengths),
+        "table_type": np.repeat(np.array([table_type for _, _, table_type, *_ in forest], dtype=object), lengths),
+        "table_ordinal": np.repeat(np.array([ordinal for *_, ordinal, _ in forest], dtype=np.int64), lengths),
+        "phenotype": np.repeat(np.array([table.phenotype for *_, table in forest], dtype=object), lengths),
+        "var_name": np.concatenate([table.table_columns["var_name"].astype(object) for *_, table in forest]
+                                   + [np.array([], dtype=object)])
+    }
+    for name in list(FOREST_DICT.keys())[1:]:
+        columns[name] = np.concatenate([_as_float(table.table_columns[name]) for *_, table in forest]
+                                       + [np.array([], dtype=np.float64)])
+
+    if exclusions is None or len(exclusions) == 0:
+        return columns
+
+    keep = ~np.isin(columns["var_name"], np.array(list(exclusions), dtype=object))
+    return {name: column[keep] for name, column in columns.items()}
+
+
+def _is_number(value):
+    """If a value is an int or float, rather than a str or other object"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _as_float(column):
+    """A column as float64, where any value that is not numeric is a missing value"""
+    if column.dtype == np.float64:
+        return column
+    return np.array([value if _is_number(value) else np.nan for value in column.tolist()], dtype=np.float64)
+
+
+def write_methods(forest, write_path, rd=2, headers=True):
+    """
+    Write the in line methods line of every forest plot row to a single file
+
+    Note
+    ----
+    Lines are identical to StataTable.in_line_methods_forest, and are streamed to the file as they are formatted, so
+    the lines of every table are never held in memory at once.
+
+    :param forest: The stacked forest plot rows from stack_forest
+    :type forest: dict[str, np.ndarray]
+
+    :param write_path: The path of the file to write
+    :type write_path: str | Path
+
+    :param rd: The amount of rounding to apply, defaults to 2
+    :type rd: int
+
+    :param headers: If True, defaults to True, then the rows of each table are preceded by a markdown heading of the
+        log, table type, table ordinal and phenotype of the table
+    :type headers: bool
+
+    :return: The number of methods lines written
+    :rtype: int
+    """
+    table_ids = forest["table_id"]
+
+    # The first row of each table, so headings are only formatted once per table
+    starts = np.flatnonzero(np.diff(table_ids, prepend=-1)) if headers else []
+    headings = {}
+    for start in starts:
+        prefix = "" if start == 0 else "\n"
+        headings[int(start)] = (f"{prefix}## {forest['log'][start]} {forest['table_type'][start]} "
+                                f"{forest['table_ordinal'][start]}: {forest['phenotype'][start]}\n\n")
+
+    rows = zip(forest["var_name"].tolist(), forest["coefficient"].tolist(), forest["lb_95"].tolist(),
+               forest["ub_95"].tolist())
+
+    with open(write_path, "w") as methods_file:
+        for i, (var_name, cf, lb, ub) in enumerate(rows):
+            if i in headings:
+                methods_file.write(headings[i])
+            methods_file.write(methods_in_line(var_name, cf, lb, ub, rd))
+    return len(table_ids)
+
+
+def to_arrow(columns):
+    """
+    Convert stacked columns to a pyarrow Table
+
+    :param columns: The stacked columns from stack_columns
+    :type columns: dict[str, np.ndarray]
+
+    :return: The columns as a pyarrow Table
+    :rtype: pyarrow.Table
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for columnar export, install it via pip install stataLogObject[arrow]")
+
+    return pyarrow.table({name: pyarrow.array(column, from_pandas=True) for name, column in columns.items()})
+
+
+def write_columnar(columns, write_path, file_format="parquet"):
+    """
+    Write stacked columns to a single columnar file
+
+    :param columns: The stacked columns from stack_columns
+    :type columns: dict[str, np.ndarray]
+
+    :param write_path: The path of the file to write
+    :type write_path: str | Path
+
+    :param file_format: The format to write, one of parquet or feather. Defaults to parquet
+    :type file_format: str
+
+    :return: Nothing, writes the file to write_path
+    :rtype: None
+    """
+    table = to_arrow(columns)
+    if file_format == "parquet":
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, str(write_path))
+    elif file_format == "feather":
+        import pyarrow.feather
+        pyarrow.feather.write_feather(table, str(write_path))
+    else:
+        raise ValueError(f"Unknown file_format {file_format}, expected one of parquet or feather")
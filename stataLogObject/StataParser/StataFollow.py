@@ -0,0 +1,142 @@
+from stataLogObject.StataParser import StataTable, StataScanner
+from stataLogObject.Configs import TableConfigs
+from stataLogObject.Supports import decode_line
+
+from pathlib import Path
+import time
+import os
+
+
+class StataFollow:
+    # The number of bytes from the start of the log compared between polls, to recognise a log replaced in place
+    _HEAD_SIZE = 1024
+
+    def __init__(self, log_path, config=None, encoding="utf-8", chunk_size=1 << 20):
+        """
+        Follow a log that is still being written to by a running Stata job, parsing each table as soon as its separator
+        rule is met rather than after the log is closed.
+
+        Between polls the byte offset that has been read up to, any partial line at the end of the file, and the tables
+        that are still being collected are all retained, so each poll only parses newly appended bytes.
+
+        :param log_path: The path to the log file
+        :type log_path: str | Path
+
+        :param config: The table configurations to isolate, defaults to TableConfigs()
+        :type config: TableConfigs | None
+
+        :param encoding: The encoding of the log file, defaults to utf-8
+        :type encoding: str
+
+        :param chunk_size: The maximum number of bytes to read from the log at a time, defaults to 1MB
+        :type chunk_size: int
+        """
+        self.log_path = Path(log_path)
+        self.config = TableConfigs() if config is None else config
+        self._configs = self.config.table_types()
+        self._encoding = encoding
+        self._chunk_size = chunk_size
+
+        self._reset()
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataFollow of {self.log_path.name} at byte {self.offset}"
+
+    def _reset(self):
+        """Start reading from the beginning of the log"""
+        self.offset = 0
+        self._partial = b""
+
+        # The device and inode of the file being read, and its first bytes, so a replaced log can be recognised
+        self._identity = None
+        self._head = b""
+        self._scanner = StataScanner({name: config.table_ext for name, config in self._configs.items()})
+
+    def poll(self):
+        """
+        Parse any bytes appended to the log since the last poll
+
+        Note
+        ----
+        If the log has been replaced (for example via log using, replace) then it is read again from the beginning.
+        The log is replaced if it is now a different file, by device and inode, if it is smaller than the offset we
+        have read up to, or if its first bytes, which hold the time the log was opened, have changed. The last covers a
+        log truncated in place and then written past the previous offset between polls.
+
+        :return: The tables completed by the appended bytes, in the order they were found in the log
+        :rtype: list[StataTable]
+        """
+        try:
+            log_file = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return []
+
+        tables = []
+        with log_file:
+            stat = os.fstat(log_file.fileno())
+            if self._identity is not None and self._replaced(log_file, stat):
+                self._reset()
+            self._identity = (stat.st_dev, stat.st_ino)
+
+            log_file.seek(self.offset)
+            for chunk in iter(lambda: log_file.read(self._chunk_size), b""):
+                if len(self._head) < self._HEAD_SIZE:
+                    self._head += chunk[:self._HEAD_SIZE - len(self._head)]
+                self.offset += len(chunk)
+
+                # The last element will be a partial line, unless the chunk ended on a new line where it is empty
+                lines = (self._partial + chunk).split(b"\n")
+                self._partial = lines.pop()
+                for line in lines:
+                    tables += self._scanner.feed(decode_line(line + b"\n", self._encoding), len(line) + 1)
+
+        return [StataTable(raw.lines, self._configs[raw.name], raw.name) for raw in tables]
+
+    def _replaced(self, log_file, stat):
+        """If the open log is no longer the log that was read up to the current offset"""
+        if (stat.st_dev, stat.st_ino) != self._identity or stat.st_size < self.offset:
+            return True
+        return log_file.read(len(self._head)) != self._head
+
+    def close(self):
+        """
+        The log has finished being written, so parse any partial final line and complete any remaining tables
+
+        :return: The remaining tables, in the order they were found in the log
+        :rtype: list[StataTable]
+        """
+        tables = self.poll()
+        raw_tables = []
+        if self._partial:
+            raw_tables += self._scanner.feed(decode_line(self._partial, self._encoding), len(self._partial))
+        raw_tables += self._scanner.close()
+
+        self._partial = b""
+        return tables + [StataTable(raw.lines, self._configs[raw.name], raw.name) for raw in raw_tables]
+
+    def follow(self, interval=1.0, idle_timeout=None):
+        """
+        Poll the log every interval seconds, yielding tables as they are completed
+
+        :param interval: The number of seconds to wait between polls, defaults to 1
+        :type interval: float
+
+        :param idle_timeout: If set, stop following once the log has not grown for this many seconds and then yield the
+            remaining tables. If None, the log is followed until the generator is closed.
+        :type idle_timeout: float | None
+
+        :return: A generator of StataTable, in the order they were found in the log
+        """
+        last_growth = time.monotonic()
+        while True:
+            offset = self.offset
+            yield from self.poll()
+
+            if self.offset != offset:
+                last_growth = time.monotonic()
+            elif idle_timeout is not None and time.monotonic() - last_growth >= idle_timeout:
+                yield from self.close()
+                return
+
+            time.sleep(interval)
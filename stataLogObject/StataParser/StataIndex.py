@@ -0,0 +1,122 @@
+from typing import NamedTuple, Optional
+from pathlib import Path
+
+
+class TableMatch(NamedTuple):
+    """
+    | A table, or a single row of a table body, found by StataIndex.find
+    |
+    | *Attributes*:
+    |    **log (Path)**: The path of the log the table was found in
+    |    **table_type (str)**: The table type name within TableConfigs
+    |    **ordinal (int)**: The position of the table within the tables of its table type in this log
+    |    **table (StataTable)**: The table
+    |    **row (Optional[int])**: The index of the matching row of the table body, or None if the match is the table
+    """
+    log: Path
+    table_type: str
+    ordinal: int
+    table: object
+    row: Optional[int]
+
+    def values(self):
+        """The value of each body column for the matching row, as a dict of entry name: value"""
+        return {name: column[self.row].item() if hasattr(column[self.row], "item") else column[self.row]
+                for name, column in self.table.table_columns.items()}
+
+
+class StataIndex:
+    def __init__(self, logs):
+        """
+        An in memory index of the tables of one or more logs, mapping variable name, phenotype, table type and log to
+        the position of each table and the rows of its body, so that finding a variable does not require scanning every
+        table.
+
+        :param logs: The log path, and a dict of table type name: list of StataTable, for each log
+        :type logs: list[(Path, dict[str, list[stataLogObject.StataParser.StataTable]])]
+        """
+        # Each table is given an id, which is its position in this list
+        self.tables = []
+
+        # Table ids for each phenotype, table type, log and variable, and for each variable the rows of each table
+        self._phenotypes = {}
+        self._table_types = {}
+        self._logs = {}
+        self._variable_tables = {}
+        self._variables = {}
+
+        for log_path, table_types in logs:
+            for table_type, tables in table_types.items():
+                for ordinal, table in enumerate(tables):
+                    self._add_table(Path(log_path), table_type, ordinal, table)
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataIndex of {len(self.tables)} tables and {len(self._variables)} variables"
+
+    def __len__(self):
+        return len(self.tables)
+
+    def _add_table(self, log_path, table_type, ordinal, table):
+        """Add a table to the index, recording the rows of its body that contain each variable"""
+        table_id = len(self.tables)
+        self.tables.append((log_path, table_type, ordinal, table))
+
+        self._phenotypes.setdefault(table.phenotype, set()).add(table_id)
+        self._table_types.setdefault(table_type, set()).add(table_id)
+        self._logs.setdefault(log_path, set()).add(table_id)
+
+        for row, var_name in enumerate(table.table_columns["var_name"].tolist()):
+            self._variable_tables.setdefault(var_name, set()).add(table_id)
+            self._variables.setdefault(var_name, {}).setdefault(table_id, []).append(row)
+
+    def find(self, var=None, phenotype=None, table_type=None, log=None):
+        """
+        Find the tables, or rows of tables, that match every criteria given
+
+        :param var: The variable name to find. If set, each matching row of each table is returned, otherwise each
+            matching table is returned with a row of None. Defaults to None.
+        :type var: str | None
+
+        :param phenotype: Only include tables with this phenotype, defaults to None
+        :type phenotype: str | None
+
+        :param table_type: Only include tables of this table type, defaults to None
+        :type table_type: str | None
+
+        :param log: Only include tables from this log, defaults to None
+        :type log: str | Path | None
+
+        :return: The matches, in the order the tables were indexed
+        :rtype: list[TableMatch]
+        """
+        candidates = []
+        if var is not None:
+            candidates.append(self._variable_tables.get(var, set()))
+        if phenotype is not None:
+            candidates.append(self._phenotypes.get(phenotype, set()))
+        if table_type is not None:
+            candidates.append(self._table_types.get(table_type, set()))
+        if log is not None:
+            candidates.append(self._logs.get(Path(log), set()))
+
+        if len(candidates) == 0:
+            table_ids = range(len(self.tables))
+        else:
+            # Intersect from the smallest set of table ids, so cost is bounded by the most selective criteria
+            candidates = sorted(candidates, key=len)
+            table_ids = sorted(candidates[0].intersection(*candidates[1:]))
+
+        if var is None:
+            return [TableMatch(*self.tables[table_id], None) for table_id in table_ids]
+
+        rows = self._variables[var] if len(table_ids) > 0 else {}
+        return [TableMatch(*self.tables[table_id], row) for table_id in table_ids for row in rows[table_id]]
+
+    def variables(self):
+        """The name of every variable in the index"""
+        return list(self._variables.keys())
+
+    def phenotypes(self):
+        """The name of every phenotype in the index"""
+        return list(self._phenotypes.keys())
@@ -1,36 +1,357 @@
-from stataLogObject.StataParser import StataRaw, StataTable
+from stataLogObject.StataParser import StataRaw, StataTable, StataScanner, StataMap, StataIndex
+from stataLogObject.StataParser.StataExport import stack_columns, stack_forest, to_arrow, write_columnar, write_methods
 from stataLogObject.Configs import TableConfigs, Table
+from stataLogObject.Supports import censure_file, is_log_path, is_plain_log, log_exists
 
+from collections import deque
 from pathlib import Path
 
 
 class StataLog:
-    def __init__(self, log_path):
+    # Attributes set on each instance, which alongside the class attributes cannot be used as table type names
+    INSTANCE_ATTRIBUTES = ("log_path", "memory_map", "stats", "config", "fingerprints")
+
+    def __init__(self, log_path, memory_map=False, lazy=True, stats=None, config=None):
+        """
+        A parsed Stata log, with a list of StataTable for each table type in TableConfigs
+
+        :param log_path: The path to the log file. This may also be a compressed log (.log.gz, .log.bz2, .log.xz or
+            .log.zst), or a log within a zip or tar archive given as the archive path followed by the member name, such
+            as logs.zip/model.log. These are decompressed as they are parsed.
+        :type log_path: str | Path
+
+        :param memory_map: If True, the log is memory mapped and only the lines of each table are decoded, which keeps
+            memory use flat for very large logs. Compressed logs cannot be memory mapped, so are always streamed.
+            Defaults to False
+        :type memory_map: bool
+
+        :param lazy: If True, tables are not isolated on construction. The log is scanned once, the first time any table
+            type is accessed, and each table type is only formatted to StataTables when it is first accessed. Tables
+            can also be streamed via iter_tables. If False, every table type is created on construction. Defaults to
+            True
+        :type lazy: bool
+
+        :param stats: If set, the time spent in each stage of parsing is recorded to it, see Supports.ParseStats.
+            Defaults to None, where nothing is recorded
+        :type stats: ParseStats | None
+
+        :param config: The table configurations to isolate, defaults to TableConfigs(), which includes any table types
+            registered via register_table
+        :type config: TableConfigs | None
+        """
 
         # Set the log path, validate it exists, and that it is .log
         self.log_path = Path(log_path)
-        assert self.log_path.exists(), "Path to .log is invalid"
-        assert self.log_path.suffix == ".log", "File is not a log, as it lacks a .log file extension"
+        self.memory_map = memory_map
+        self.stats = stats
+        assert log_exists(self.log_path), "Path to .log is invalid"
+        assert is_log_path(self.log_path), "File is not a log, as it lacks a .log file extension"
 
         # Set the config object for known table types
-        self.config = TableConfigs()
+        self.config = TableConfigs() if config is None else config
+
+        # The raw tables of each table type that have yet to be formatted, and the formatted tables of each table type
+        self._raw = None
+        self._tables = {}
+        self._index = None
+
+        if not lazy:
+            self.load()
+
+    @classmethod
+    def from_stream(cls, log_path, log_file, stats=None, config=None):
+        """
+        Parse a log from an open binary stream, formatting every table type before returning so the stream is only
+        needed for the duration of this call. This allows each log within an archive to be parsed as the archive is
+        walked once, see Supports.iter_archive. A later reparse reads the log from log_path.
+
+        :param log_path: The path to the log, or to a member of an archive
+        :type log_path: str | Path
+
+        :param log_file: An open binary stream of the log
+        :type log_file: io.BufferedIOBase
+
+        :param stats: See StataLog, defaults to None
+        :type stats: ParseStats | None
+
+        :param config: See StataLog, defaults to None
+        :type config: TableConfigs | None
+
+        :return: The parsed log
+        :rtype: StataLog
+        """
+        log = cls(log_path, stats=stats, config=config)
+        log.scan_tables(log_file)
+        return log
+
+    # Create lists of table objects for each object in the self.config
+    @property
+    def ols(self):
+        return self._table_type("ols")
+
+    @property
+    def ols_clu(self):
+        return self._table_type("ols_clu")
+
+    @property
+    def hdfe(self):
+        return self._table_type("hdfe")
+
+    # Panel variables
+    @property
+    def fe_within(self):
+        return self._table_type("fe_within")
+
+    @property
+    def re_gls(self):
+        return self._table_type("re_gls")
+
+    # Mixed
+    @property
+    def mixed(self):
+        return self._table_type("mixed")
+
+    # Binary outcomes
+    @property
+    def probit(self):
+        return self._table_type("probit")
+
+    @property
+    def logit(self):
+        return self._table_type("logit")
+
+    # Summary
+    # TODO: Summary fails when there are no obs
+    @property
+    def summary(self):
+        return self._table_type("summary")
+
+    @property
+    def tabulate(self):
+        return self._table_type("tabulate")
+
+    def __getattr__(self, name):
+        """Table types registered via register_table, or given in config, are accessed like the built in table types"""
+        config = self.__dict__.get("config")
+        if name.startswith("_") or config is None or name not in config.table_types():
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self._table_type(name)
+
+    def load(self):
+        """
+        Format every table type now rather than when they are first accessed
+
+        :return: This log
+        :rtype: StataLog
+        """
+        [self._table_type(name) for name in self.config.table_types()]
+        return self
+
+    def _table_type(self, name):
+        """
+        The list of StataTable for a table type, which is formatted from the raw tables of a single pass of the log the
+        first time it is requested
+
+        :param name: The table type name within self.config
+        :type name: str
+
+        :return: The tables of this table type, in the order they were found in the log
+        :rtype: list[StataTable]
+        """
+        if name not in self._tables:
+            if self._raw is None:
+                self._raw, self.fingerprints = self._index_log()
+
+            # The raw tables are only released once every table of this type has been formatted, so that an error
+            # formatting one of them is raised again on the next access rather than losing the raw tables
+            self._tables[name] = self._format_tables(name, self._raw[name])
+            del self._raw[name]
+        return self._tables[name]
+
+    def _index_log(self, log_file=None):
+        """
+        Isolate the raw tables for every table type in self.config in a single pass of the log, or of log_file if set
+
+        Note
+        ----
+        The table type, byte range and fingerprint of each raw table are returned in log order, to be kept as
+        self.fingerprints, so that a later reparse can identify which tables are unchanged. Nothing is assigned here,
+        so a scan that is interrupted leaves the previous state of this log in place.
+
+        :return: The raw tables and their fingerprint for each table type, and the fingerprint of each raw table
+        :rtype: (dict[str, list[(RawTable, str)]], list[(str, int, int, str)])
+        """
+        raw_tables = {name: [] for name in self.config.table_types()}
+        fingerprints = []
+        for raw in self._iter_raw(log_file):
+            fingerprint = raw.fingerprint()
+            fingerprints.append((raw.name, raw.offset, raw.end, fingerprint))
+            raw_tables[raw.name].append((raw, fingerprint))
+        return raw_tables, fingerprints
+
+    def _format_tables(self, name, raw_tables, previous=None):
+        """
+        Format the raw tables of a table type to StataTable Generic
+
+        :param name: The table type name within self.config
+        :type name: str
+
+        :param raw_tables: The raw tables of this table type and their fingerprint, from _index_log
+        :type raw_tables: list[(RawTable, str)]
+
+        :param previous: StataTables from a previous parse keyed by table type and fingerprint. Where a raw table
+            matches one of these it is reused rather than being formatted again. Defaults to None.
+        :type previous: dict[(str, str), collections.deque[StataTable]] | None
 
-        # Create lists of table objects for each object in the self.config
-        self.ols = self.create_tables(self.config.ols)
-        self.ols_clu = self.create_tables(self.config.ols_clu)
-        self.hdfe = self.create_tables(self.config.hdfe)
+        :return: The tables of this table type, in the order they were found in the log
+        :rtype: list[StataTable]
+        """
+        config = self.config.table_types()[name]
+        previous = {} if previous is None else previous
+
+        tables = []
+        for raw, fingerprint in raw_tables:
+            reusable = previous.get((name, fingerprint))
+            tables.append(reusable.popleft() if reusable else StataTable(raw.lines, config, name, self.stats))
+        return tables
+
+    def scan_tables(self, log_file=None):
+        """
+        Isolate the raw tables for every table type in self.config in a single pass of the log, then format each to a
+        StataTable Generic
+
+        :param log_file: An open binary stream of the log to read rather than opening log_path, defaults to None
+        :type log_file: io.BufferedIOBase | None
+
+        :return: A dict of table type name: list of StataTable, in the order they were found in the log
+        :rtype: dict[str, list[StataTable]]
+        """
+        raw_tables, fingerprints = self._index_log(log_file)
+        tables = {name: self._format_tables(name, raw_tables[name]) for name in self.config.table_types()}
+
+        self._raw, self.fingerprints, self._tables, self._index = {}, fingerprints, tables, None
+        return dict(self._tables)
+
+    def reparse(self):
+        """
+        Parse the log again after it has been replaced, such as when a do-file is re-run, only formatting the tables
+        whose raw lines have changed and reusing the rest from the previous parse. Table types that have not yet been
+        accessed remain lazy.
+
+        :return: The number of tables that were formatted again
+        :rtype: int
+        """
+        previous = {}
+        if self._raw is not None:
+            type_tables = {name: iter(tables) for name, tables in self._tables.items()}
+            for table_type, _, _, fingerprint in self.fingerprints:
+                if table_type in type_tables:
+                    previous.setdefault((table_type, fingerprint), deque()).append(next(type_tables[table_type]))
+        reusable = sum([len(tables) for tables in previous.values()])
+
+        raw_tables, fingerprints = self._index_log()
+        tables = {name: self._format_tables(name, raw_tables.pop(name), previous) for name in self._tables}
 
-        # Panel variables
-        self.fe_within = self.create_tables(self.config.fe_within)
-        # TODO: Random-effects
+        self._raw, self.fingerprints, self._tables, self._index = raw_tables, fingerprints, tables, None
 
-        # Mixed
-        self.mixed = self.create_tables(self.config.mixed)
+        reused = reusable - sum([len(tables) for tables in previous.values()])
+        return sum([len(tables) for tables in self._tables.values()]) - reused
 
-        # Summary
-        # TODO: Summary fails when there are no obs
-        self.summary = self.create_tables(self.config.summary)
-        self.tabulate = self.create_tables(self.config.tabulate)
+    def iter_tables(self):
+        """
+        Lazily isolate the tables of every table type in self.config, formatting each to a StataTable Generic as soon as
+        it is complete. Only the tables currently being collected are held in memory, so results can be streamed to
+        another output while the log is read.
+
+        :return: A generator of StataTable, in the order they were found in the log, with table_type set
+        """
+        configs = self.config.table_types()
+        for raw in self._iter_raw():
+            yield StataTable(raw.lines, configs[raw.name], raw.name, self.stats)
+
+    def _iter_raw(self, log_file=None):
+        """
+        Isolate the raw tables of every table type in self.config, in the order they were found in the log. If log_file
+        is set then it is read rather than log_path.
+        """
+        isolators = {name: config.table_ext for name, config in self.config.table_types().items()}
+        if log_file is not None:
+            scanner = StataScanner(isolators)
+        elif self.memory_map and is_plain_log(self.log_path):
+            scanner = StataMap(isolators)
+        else:
+            scanner = StataScanner(isolators)
+
+        if self.stats is None:
+            return scanner.scan(self.log_path) if log_file is None else scanner.scan(self.log_path, log_file)
+        return self.stats.scan(scanner, self.log_path, log_file)
+
+    def table_types(self):
+        """Returns each table type name alongside its list of StataTable"""
+        return {name: self._table_type(name) for name in self.config.table_types()}
+
+    @property
+    def index(self):
+        """
+        The StataIndex of every table in this log, which is built the first time it is requested and rebuilt after a
+        reparse
+
+        :rtype: StataIndex
+        """
+        if self._index is None:
+            self._index = StataIndex([(self.log_path, self.table_types())])
+        return self._index
+
+    def find(self, var=None, phenotype=None, table_type=None):
+        """
+        Find the tables, or rows of tables, of this log that match every criteria given, see StataIndex.find
+
+        :return: The matches, in the order they were found in the log within each table type
+        :rtype: list[stataLogObject.StataParser.TableMatch]
+        """
+        return self.index.find(var, phenotype, table_type)
+
+    def to_columns(self):
+        """
+        Stack every table of this log into a single set of columns, with one row per variable of each table body, see
+        StataExport.stack_columns
+
+        :return: A dict of column name: array
+        :rtype: dict[str, numpy.ndarray]
+        """
+        return stack_columns([(self.log_path, self.table_types())])
+
+    def forest_columns(self, exclusions=None, table_types=None):
+        """
+        Stack the forest plot rows of every table of this log into a single set of columns, with a table_id column, see
+        StataExport.stack_forest
+
+        :return: A dict of column name: array
+        :rtype: dict[str, numpy.ndarray]
+        """
+        return stack_forest([(self.log_path, self.table_types())], exclusions, table_types)
+
+    def write_methods(self, write_path, rd=2, exclusions=None, table_types=None, headers=True):
+        """
+        Write the in line methods line of every forest plot row of every table of this log to a single file, see
+        StataExport.write_methods
+
+        :return: The number of methods lines written
+        :rtype: int
+        """
+        return write_methods(self.forest_columns(exclusions, table_types), write_path, rd, headers)
+
+    def to_arrow(self):
+        """Every table of this log stacked into a single pyarrow Table, requires pyarrow"""
+        return to_arrow(self.to_columns())
+
+    def write_parquet(self, write_path):
+        """Write every table of this log stacked into a single parquet file, requires pyarrow"""
+        write_columnar(self.to_columns(), write_path, "parquet")
+
+    def write_feather(self, write_path):
+        """Write every table of this log stacked into a single feather file, requires pyarrow"""
+        write_columnar(self.to_columns(), write_path, "feather")
 
     def create_tables(self, config):
         """
@@ -39,27 +360,24 @@ class StataLog:
         :param config: The configuration Table Object for this log table that we wish to isolate
         :type config: Table
         """
-        return [StataTable(table, config) for table in StataRaw(self.log_path, config.table_ext).raw_tables]
+        raw_tables = StataRaw(self.log_path, config.table_ext, self.stats).raw_tables
+        return [StataTable(table, config, stats=self.stats) for table in raw_tables]
 
-    def censure_log(self):
+    def censure_log(self, patterns=None, replacement="[censured]"):
         """
         Logs from stata often contain a path which can be problematic if they are to sensitive locations so this
-        censures them.
+        censures them, alongside anything that matches the optional patterns. The log is streamed into a temporary file
+        which then atomically replaces it, see Supports.censure_file
+
+        :param patterns: Regular expressions, whose matches will be replaced with replacement. Defaults to None
+        :type patterns: list[str] | None
+
+        :param replacement: The replacement for matches of patterns, defaults to [censured]
+        :type replacement: str
 
         :return: Nothing, override the log file
         :rtype: None
-        """
-
-        # Remove the path to log: locations
-        log_raw = []
-        with open(self.log_path, "r") as log_file:
-            for line in log_file:
-                if "log:" in line:
-                    log_raw.append(f"{line.split(':')[0]}: \n")
-                else:
-                    log_raw.append(line)
 
-        # Override the file
-        with open(self.log_path, "w") as log_file:
-            for line in log_raw:
-                log_file.write(line)
+        :raises LogNotPlain: If the log is compressed or within an archive
+        """
+        censure_file(self.log_path, patterns, replacement)
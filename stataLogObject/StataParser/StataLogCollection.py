@@ -0,0 +1,286 @@
+from stataLogObject.StataParser.StataExport import stack_columns, stack_forest, to_arrow, write_columnar, write_methods
+from stataLogObject.StataParser.StataLog import StataLog
+from stataLogObject.StataParser import StataIndex
+from stataLogObject.Supports import censure_file, find_sources, iter_archive
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from pathlib import Path
+
+
+# Each worker records rather than raises any error, so that one invalid log does not stop the batch
+
+
+def _parse_log(log_path, memory_map, store=None):
+    """
+    Parse a single log
+
+    :param store: If set, a callable that opens a StataStore, such as a partial of StataStore, which the log is written
+        to from this worker rather than being returned. Defaults to None
+    :type store: (() -> stataLogObject.StataStore) | None
+
+    :return: The log path, the parsed log or None, and the error message or None, as a list of one
+    :rtype: list[(Path, StataLog | None, str | None)]
+    """
+    try:
+        log = StataLog(log_path, memory_map=memory_map).load()
+        if store is not None:
+            with store() as opened:
+                opened.add_log(log)
+            log = None
+        return [(log_path, log, None)]
+    except Exception as e:
+        return [(log_path, None, f"{type(e).__name__}: {e}")]
+
+
+def _parse_archive(archive_path, pattern, store=None):
+    """
+    Parse every log within an archive as it is walked once, see _parse_log for store
+
+    :return: The log path, the parsed log or None, and the error message or None, for each log within the archive
+    :rtype: list[(Path, StataLog | None, str | None)]
+    """
+    results = []
+    try:
+        # A single connection is opened for every log within the archive
+        with nullcontext() if store is None else store() as opened:
+            for log_path, log_file in iter_archive(archive_path, pattern):
+                try:
+                    log = StataLog.from_stream(log_path, log_file)
+                    if opened is not None:
+                        opened.add_log(log)
+                        log = None
+                    results.append((log_path, log, None))
+                except Exception as e:
+                    results.append((log_path, None, f"{type(e).__name__}: {e}"))
+    except Exception as e:
+        results.append((archive_path, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _censure_log(log_path, patterns, replacement):
+    """
+    Censure a single log
+
+    :return: The log path, and the error message or None
+    :rtype: (Path, str | None)
+    """
+    try:
+        censure_file(log_path, patterns, replacement)
+        return log_path, None
+    except Exception as e:
+        return log_path, f"{type(e).__name__}: {e}"
+
+
+class StataLogCollection:
+    def __init__(self, logs, errors=None):
+        """
+        A collection of parsed Stata logs
+
+        :param logs: The parsed logs, keyed by their log path
+        :type logs: dict[Path, StataLog]
+
+        :param errors: The error message of each log that failed to parse, keyed by their log path
+        :type errors: dict[Path, str] | None
+        """
+        self.logs = logs
+        self.errors = {} if errors is None else errors
+        self._index = None
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataLogCollection of {len(self.logs)} logs with {len(self.errors)} errors"
+
+    def __len__(self):
+        return len(self.logs)
+
+    def __iter__(self):
+        return iter(self.logs.values())
+
+    def __getitem__(self, log_path):
+        return self.logs[Path(log_path)]
+
+    @classmethod
+    def from_directory(cls, directory, workers=None, pattern="*.log", recursive=True, ordered=True, memory_map=False,
+                       threads=False, archives=True):
+        """
+        Parse every log within a directory, including compressed logs such as .log.gz, see Supports.find_logs
+
+        :param directory: The directory containing the logs
+        :type directory: str | Path
+
+        :param workers: The number of processes to parse with. Defaults to None, which uses the number of cpus. If 1
+            then logs are parsed in this process.
+        :type workers: int | None
+
+        :param pattern: The glob pattern logs must match once any compression suffix is removed, defaults to *.log
+        :type pattern: str
+
+        :param recursive: If True, defaults to True, then sub directories are also searched
+        :type recursive: bool
+
+        :param ordered: If True, defaults to True, logs are ordered by their path. Otherwise they are in the order they
+            finished parsing
+        :type ordered: bool
+
+        :param memory_map: Passed to each StataLog, defaults to False
+        :type memory_map: bool
+
+        :param threads: If True, logs are parsed in a thread pool rather than a process pool. The table configurations
+            are read only during a parse, so they are shared by every thread. This avoids pickling each parsed log back
+            to this process, and parses in parallel on free-threaded builds. Defaults to False
+        :type threads: bool
+
+        :param archives: If True, defaults to True, then the logs within zip and tar archives are also parsed. Each
+            archive is walked once by a single worker, parsing each log as it is reached, so a compressed tar is only
+            decompressed once
+        :type archives: bool
+
+        :return: The collection of parsed logs
+        :rtype: StataLogCollection
+        """
+        log_paths, archive_paths = find_sources(directory, pattern, recursive, archives)
+        tasks = [(_parse_log, path, memory_map) for path in log_paths]
+        tasks += [(_parse_archive, path, pattern) for path in archive_paths]
+        return cls._run(tasks, workers, ordered, threads)
+
+    @classmethod
+    def from_paths(cls, log_paths, workers=None, ordered=True, memory_map=False, threads=False):
+        """
+        Parse each log in a list of log paths, see from_directory for parameters
+
+        :return: The collection of parsed logs
+        :rtype: StataLogCollection
+        """
+        log_paths = sorted([Path(path) for path in log_paths])
+        return cls._run([(_parse_log, path, memory_map) for path in log_paths], workers, ordered, threads)
+
+    @classmethod
+    def _run(cls, tasks, workers, ordered, threads):
+        """
+        Run each parsing task, of a function and its arguments which returns a list of results, see from_directory for
+        parameters
+
+        :return: The collection of parsed logs
+        :rtype: StataLogCollection
+        """
+        if workers == 1:
+            results = [function(*args) for function, *args in tasks]
+        else:
+            pool = ThreadPoolExecutor if threads else ProcessPoolExecutor
+            with pool(max_workers=workers) as executor:
+                futures = [executor.submit(function, *args) for function, *args in tasks]
+                results = [future.result() for future in (futures if ordered else as_completed(futures))]
+
+        results = [result for task_results in results for result in task_results]
+        if ordered:
+            results = sorted(results, key=lambda result: result[0])
+
+        # Logs that were written to a store by their worker are not returned, so only their errors are kept
+        logs = {path: log for path, log, _ in results if log is not None}
+        errors = {path: error for path, _, error in results if error is not None}
+        return cls(logs, errors)
+
+    @staticmethod
+    def censure_directory(directory, patterns=None, replacement="[censured]", workers=None, pattern="*.log",
+                          recursive=True):
+        """
+        Censure every log within a directory in parallel, see Supports.censure_file
+
+        :param directory: The directory containing the logs
+        :type directory: str | Path
+
+        :param patterns: Regular expressions, whose matches will be replaced with replacement. Defaults to None
+        :type patterns: list[str] | None
+
+        :param replacement: The replacement for matches of patterns, defaults to [censured]
+        :type replacement: str
+
+        :param workers: The number of processes to censure with. Defaults to None, which uses the number of cpus. If 1
+            then logs are censured in this process.
+        :type workers: int | None
+
+        :param pattern: The glob pattern logs must match, defaults to *.log
+        :type pattern: str
+
+        :param recursive: If True, defaults to True, then sub directories are also searched
+        :type recursive: bool
+
+        :return: The error message of each log that failed to be censured, keyed by their log path
+        :rtype: dict[Path, str]
+        """
+        directory = Path(directory)
+        log_paths = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        log_paths = sorted([path for path in log_paths if path.is_file()])
+
+        if workers == 1:
+            results = [_censure_log(path, patterns, replacement) for path in log_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_censure_log, log_paths, [patterns] * len(log_paths),
+                                            [replacement] * len(log_paths)))
+
+        return {path: error for path, error in results if error is not None}
+
+    @property
+    def index(self):
+        """
+        The StataIndex of every table of every log, which is built the first time it is requested
+
+        :rtype: StataIndex
+        """
+        if self._index is None:
+            self._index = StataIndex([(log_path, log.table_types()) for log_path, log in self.logs.items()])
+        return self._index
+
+    def find(self, var=None, phenotype=None, table_type=None, log=None):
+        """
+        Find the tables, or rows of tables, of every log that match every criteria given, see StataIndex.find
+
+        :return: The matches, in the order of the logs and then the order they were found in each log
+        :rtype: list[stataLogObject.StataParser.TableMatch]
+        """
+        return self.index.find(var, phenotype, table_type, log)
+
+    def to_columns(self):
+        """
+        Stack every table of every log into a single set of columns, with one row per variable of each table body, see
+        StataExport.stack_columns
+
+        :return: A dict of column name: array
+        :rtype: dict[str, numpy.ndarray]
+        """
+        return stack_columns([(log_path, log.table_types()) for log_path, log in self.logs.items()])
+
+    def forest_columns(self, exclusions=None, table_types=None):
+        """
+        Stack the forest plot rows of every table of every log into a single set of columns, with a table_id column, see
+        StataExport.stack_forest
+
+        :return: A dict of column name: array
+        :rtype: dict[str, numpy.ndarray]
+        """
+        logs = [(log_path, log.table_types()) for log_path, log in self.logs.items()]
+        return stack_forest(logs, exclusions, table_types)
+
+    def write_methods(self, write_path, rd=2, exclusions=None, table_types=None, headers=True):
+        """
+        Write the in line methods line of every forest plot row of every table of every log to a single file, see
+        StataExport.write_methods
+
+        :return: The number of methods lines written
+        :rtype: int
+        """
+        return write_methods(self.forest_columns(exclusions, table_types), write_path, rd, headers)
+
+    def to_arrow(self):
+        """Every table of every log stacked into a single pyarrow Table, requires pyarrow"""
+        return to_arrow(self.to_columns())
+
+    def write_parquet(self, write_path):
+        """Write every table of every log stacked into a single parquet file, requires pyarrow"""
+        write_columnar(self.to_columns(), write_path, "parquet")
+
+    def write_feather(self, write_path):
+        """Write every table of every log stacked into a single feather file, requires pyarrow"""
+        write_columnar(self.to_columns(), write_path, "feather")
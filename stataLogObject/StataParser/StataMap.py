@@ -0,0 +1,203 @@
+from stataLogObject.StataParser.StataScanner import RawTable, DividerTrie, StataScanner
+from stataLogObject.Configs import ExtractTable
+from stataLogObject.Supports import clean_line, decode_line
+
+from pathlib import Path
+import mmap
+
+
+class StataMap:
+    # Literals shorter than this are only used as anchors when a divider has nothing longer, as they are too common
+    MIN_ANCHOR = 4
+
+    def __init__(self, isolators, encoding="utf-8"):
+        """
+        Isolates the raw tables of many table types from a memory mapped log.
+
+        Rather than decoding and cleaning every line, a few literal anchor tokens that between them appear in every
+        divider are searched for on the mapped buffer via find, which runs at memory speed. Only the lines containing
+        an anchor are decoded and cleaned, and then matched against the same DividerTrie as StataScanner, so a line that
+        matches the divider of several table types starts a table of each. Only the lines that belong to a table are
+        then decoded, so memory use does not grow with the size of the log.
+
+        :param isolators: The Extraction elements for each table type, keyed by the table type name
+        :type isolators: dict[str, ExtractTable]
+
+        :param encoding: The encoding of the log file, defaults to utf-8
+        :type encoding: str
+        """
+        self._iso = isolators
+        self._encoding = encoding
+        self._trie = DividerTrie(isolators)
+        self._anchors = self._select_anchors(isolators, encoding)
+
+        # Only the lines containing an anchor and the lines of each table are decoded, but every byte is searched
+        self.lines_scanned = 0
+        self.bytes_read = 0
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataMap for {list(self._iso.keys())}"
+
+    @staticmethod
+    def _literals(isolator):
+        """
+        The part of each token of a divider that will appear unchanged in the bytes of a line that matches it
+
+        Note
+        ----
+        clean_line replaces a leading -. with -0., and decoding replaces invalid bytes with U+FFFD, so these parts of a
+        token are not searched for.
+
+        :param isolator: The Extraction elements for this table
+        :type isolator: ExtractTable
+
+        :return: The literal of each token, where any that are empty are removed
+        :rtype: list[str]
+        """
+        literals = []
+        for token in isolator.divider:
+            token = token[2:] if token.startswith("-0.") else token
+            literal = max(token.split("\ufffd"), key=len)
+            if len(literal) > 0:
+                literals.append(literal)
+        return literals
+
+    @classmethod
+    def _select_anchors(cls, isolators, encoding):
+        """
+        Choose literal tokens such that every divider contains at least one of them, preferring tokens shared by many
+        dividers so the number of searches of the buffer does not grow with the number of table types
+
+        :param isolators: The Extraction elements for each table type, keyed by the table type name
+        :type isolators: dict[str, ExtractTable]
+
+        :param encoding: The encoding of the log file
+        :type encoding: str
+
+        :return: The anchors as encoded bytes, or None if a divider has no literal tokens
+        :rtype: list[bytes] | None
+        """
+        literals = {name: set(cls._literals(iso)) for name, iso in isolators.items()}
+        if any([len(divider) == 0 for divider in literals.values()]):
+            return None
+
+        anchors = []
+        uncovered = dict(literals)
+        while len(uncovered) > 0:
+            candidates = {literal for divider in uncovered.values() for literal in divider
+                          if len(literal) >= cls.MIN_ANCHOR}
+            if len(candidates) == 0:
+                # The remaining dividers only contain short tokens, so each is anchored on its own longest token
+                anchors += list(dict.fromkeys([max(sorted(divider), key=len) for divider in uncovered.values()]))
+                break
+
+            anchor = max(sorted(candidates), key=lambda c: (sum([c in d for d in uncovered.values()]), len(c)))
+            anchors.append(anchor)
+            uncovered = {name: divider for name, divider in uncovered.items() if anchor not in divider}
+
+        return [anchor.encode(encoding) for anchor in anchors]
+
+    def scan(self, log_path):
+        """
+        Scan a log file, yielding each table as it is completed
+
+        :param log_path: The path to the log file
+        :type log_path: Path
+
+        :return: A generator of RawTable's, in the order they were started in the log
+        """
+        # A divider without any literal token cannot be searched for, so every line must be decoded
+        if self._anchors is None:
+            scanner = StataScanner(self._iso)
+            yield from scanner.scan(log_path)
+            self.lines_scanned += scanner.lines_scanned
+            self.bytes_read += scanner.bytes_read
+            return
+
+        with open(log_path, "rb") as log_file:
+
+            # Empty files cannot be memory mapped, but also contain no tables
+            if Path(log_path).stat().st_size == 0:
+                return
+
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.bytes_read += len(buffer)
+                line_index = 0
+                line_offset = 0
+                for line_start in self._candidate_lines(buffer):
+                    line_end = buffer.find(b"\n", line_start)
+                    line_end = len(buffer) if line_end == -1 else line_end + 1
+
+                    names = self._trie.match(clean_line(decode_line(buffer[line_start:line_end], self._encoding)))
+                    if len(names) == 0:
+                        self.lines_scanned += 1
+                        continue
+
+                    line_index += self._count_lines(buffer, line_offset, line_start)
+                    line_offset = line_start
+                    for name in names:
+                        table = self._extract_raw_table(buffer, name, line_index, line_start)
+                        self.lines_scanned += len(table.lines)
+                        yield table
+
+    def _candidate_lines(self, buffer):
+        """
+        Find the start of every line that contains an anchor
+
+        :param buffer: The memory mapped log
+        :type buffer: mmap.mmap
+
+        :return: The byte offset of the start of each line containing an anchor, in log order
+        :rtype: list[int]
+        """
+        line_starts = set()
+        for anchor in self._anchors:
+            position = buffer.find(anchor)
+            while position != -1:
+                line_starts.add(buffer.rfind(b"\n", 0, position) + 1)
+
+                # Any further occurrence on this line would give the same line, so search from the next line
+                line_end = buffer.find(b"\n", position)
+                if line_end == -1:
+                    break
+                position = buffer.find(anchor, line_end + 1)
+        return sorted(line_starts)
+
+    @staticmethod
+    def _count_lines(buffer, start, end, chunk=1 << 20):
+        """Count the new lines between start and end in the buffer, copying at most chunk bytes at a time"""
+        return sum([buffer[i:min(i + chunk, end)].count(b"\n") for i in range(start, end, chunk)])
+
+    def _extract_raw_table(self, buffer, name, line_index, offset):
+        """
+        Decode lines from the offset of a divider until the separator rule for this table type is met
+
+        :param buffer: The memory mapped log
+        :type buffer: mmap.mmap
+
+        :param name: The table type name of this divider
+        :type name: str
+
+        :param line_index: The index of the line the divider was found on
+        :type line_index: int
+
+        :param offset: The byte offset of the start of the line the divider was found on
+        :type offset: int
+
+        :return: The raw table
+        :rtype: RawTable
+        """
+        table = RawTable(name, self._iso[name].separator, line_index, offset)
+
+        position = offset
+        while position < len(buffer) and not table.complete:
+            line_end = buffer.find(b"\n", position)
+            line_end = len(buffer) if line_end == -1 else line_end + 1
+
+            table.add_line(clean_line(decode_line(buffer[position:line_end], self._encoding)))
+            position = line_end
+
+        table.complete = True
+        table.end = position
+        return table
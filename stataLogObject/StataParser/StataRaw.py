@@ -1,11 +1,11 @@
+from stataLogObject.StataParser.StataScanner import StataScanner
 from stataLogObject.Configs import ExtractTable
-from stataLogObject.Supports import clean_line
 
 from pathlib import Path
 
 
 class StataRaw:
-    def __init__(self, log_path, isolator):
+    def __init__(self, log_path, isolator, stats=None):
         """
 
         :param log_path: The path to the log file
@@ -13,62 +13,32 @@ class StataRaw:
 
         :param isolator: The Extraction elements for this table, contains dividers, space count and skip indexes
         :type isolator: ExtractTable
+
+        :param stats: If set, the scan of the log is recorded to it, defaults to None
+        :type stats: stataLogObject.Supports.ParseStats | None
         """
 
         # Initializers
         self._log_path = log_path
         self._iso = isolator
+        self._stats = stats
 
-        # Raw table that has been extracted
-        self.raw_tables = [self._extract_raw_table(i) for i in self._find_start_indexes()]
+        # Raw tables that have been extracted, and the indexes of the log lines they started on
+        tables = self._extract_raw_tables()
+        self.start_indexes = [table.start for table in tables]
+        self.raw_tables = [table.lines for table in tables]
 
     def __repr__(self):
         """Human readable output"""
         return f"StataRaw with {len(self.raw_tables)} tables"
 
-    def _find_start_indexes(self):
-        """
-        Find the starting indexes from the log file where the line matches the divider
-        """
-        with open(self._log_path, "r") as log_file:
-            return [index for index, line in enumerate(log_file) if self._evaluate_start_line(line)]
-
-    def _evaluate_start_line(self, line):
-        """Evaluate if the cleaned start line, minus elements in skip_indexes, equals the divider"""
-        return [v for i, v in enumerate(clean_line(line)) if i not in self._iso.skip_indexes] == self._iso.divider
-
-    def _extract_raw_table(self, index):
+    def _extract_raw_tables(self):
         """
-        For each given start index, isolate the elements of this table given the space_count
-
-        :param index: The current start index of the file lines
-        :type index: int
+        Find the lines of the log file that match the divider, and collect the rows of each table as we go, so the log
+        is only read once regardless of how many tables it contains
 
-        :return: The list of all the rows that are relevant to this table
-        :rtype: list
+        :return: The tables, with all the rows that are relevant to each table, in the order they were found
+        :rtype: list[stataLogObject.StataParser.StataScanner.RawTable]
         """
-        # Set the per table iterable elements
-        current_element = []
-        spacer = 0
-
-        with open(self._log_path, "r") as log_file:
-
-            # Skip the lines we don't need for this table index
-            [log_file.readline() for _ in range(index)]
-
-            for index, line in enumerate(log_file):
-                # Convert the string line with regular expressions into a list of space separated items.
-                cleaned = clean_line(line)
-
-                # If we find an empty line, and we have reached the limited of empty lines we are allowed to find
-                if (len(cleaned) == 0) and (spacer == self._iso.separator) and (len(current_element) > 0):
-                    return current_element
-
-                # Otherwise if the line is empty but less than the allowed maximum, iterate the found empty upwards
-                elif len(cleaned) == 0 and spacer < self._iso.separator:
-                    spacer += 1
-
-                # If we are currently within a table then append to current_element
-                else:
-                    current_element.append(cleaned)
-        return current_element
+        scanner = StataScanner({"raw": self._iso})
+        return list(scanner.scan(self._log_path) if self._stats is None else self._stats.scan(scanner, self._log_path))
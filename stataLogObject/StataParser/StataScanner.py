@@ -0,0 +1,242 @@
+from stataLogObject.Configs import ExtractTable
+from stataLogObject.Supports import clean_line, decode_line, open_log
+
+from collections import deque
+from pathlib import Path
+import hashlib
+
+
+class RawTable:
+    def __init__(self, name, separator, start, offset=None):
+        """
+        A table isolated from the log, which collects cleaned lines until its separator rule is met
+
+        :param name: The name of the table type within TableConfigs this table was isolated for
+        :type name: str
+
+        :param separator: The number of empty lines allowed before the table is considered finished
+        :type separator: int
+
+        :param start: The index of the line in the log where the divider was found
+        :type start: int
+
+        :param offset: The byte offset of the line in the log where the divider was found, if known
+        :type offset: int | None
+        """
+        self.name = name
+        self.start = start
+        self.offset = offset
+        self.end = None
+        self.lines = []
+        self.complete = False
+
+        self._separator = separator
+        self._spacer = 0
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"RawTable {self.name} at line {self.start} with {len(self.lines)} lines"
+
+    def add_line(self, cleaned):
+        """
+        Add a cleaned line to this table
+
+        :param cleaned: A line of the log that has been cleaned via clean_line
+        :type cleaned: list[str]
+
+        :return: True if this line completed the table, else False
+        :rtype: bool
+        """
+        # If we find an empty line, and we have reached the limited of empty lines we are allowed to find
+        if (len(cleaned) == 0) and (self._spacer == self._separator) and (len(self.lines) > 0):
+            self.complete = True
+
+        # Otherwise if the line is empty but less than the allowed maximum, iterate the found empty upwards
+        elif len(cleaned) == 0 and self._spacer < self._separator:
+            self._spacer += 1
+
+        # If we are currently within a table then append to the lines
+        else:
+            self.lines.append(cleaned)
+        return self.complete
+
+    def fingerprint(self):
+        """A hash of the cleaned lines of this table, so unchanged tables can be identified between parses"""
+        return hashlib.sha1("\n".join([" ".join(line) for line in self.lines]).encode()).hexdigest()
+
+
+class DividerTrie:
+    # The key of the child of a node that any token may follow
+    WILDCARD = None
+
+    def __init__(self, isolators):
+        """
+        A token trie of the dividers of many table types, so the cost of recognising the start of a table depends on the
+        tokens of the line rather than the number of table types.
+
+        Note
+        ----
+        Skip indexes remove the elements of a line that exist at that position, so a divider may match lines of any
+        length where the number of elements that are not skipped is equal to the length of the divider. Each valid
+        length is inserted as its own path through the trie, with the skipped positions as wildcards. A table type is
+        recorded on the node at the end of each path, and only matches lines that end at that node.
+
+        :param isolators: The Extraction elements for each table type, keyed by the table type name
+        :type isolators: dict[str, ExtractTable]
+        """
+        self._root = ({}, [])
+        self._order = {name: i for i, name in enumerate(isolators.keys())}
+        for name, iso in isolators.items():
+            for path in self._divider_paths(iso):
+                self._insert(path, name)
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"DividerTrie of {len(self._order)} table types"
+
+    @classmethod
+    def _divider_paths(cls, isolator):
+        """Each sequence of tokens, with skipped positions as wildcards, that the divider of a table type matches"""
+        skip = set(isolator.skip_indexes)
+        paths = []
+        for length in range(len(isolator.divider), len(isolator.divider) + len(skip) + 1):
+            if len([i for i in range(length) if i not in skip]) == len(isolator.divider):
+                divider = iter(isolator.divider)
+                paths.append([cls.WILDCARD if i in skip else next(divider) for i in range(length)])
+        return paths
+
+    def _insert(self, path, name):
+        """Add a path to the trie, recording the table type name on the node it ends at"""
+        node = self._root
+        for token in path:
+            node = node[0].setdefault(token, ({}, []))
+        node[1].append(name)
+
+    def match(self, cleaned):
+        """
+        Return the names of the table types whose divider matches this cleaned line
+
+        :param cleaned: A line of the log that has been cleaned via clean_line
+        :type cleaned: list[str]
+
+        :return: The matching table type names, in the order the table types were given
+        :rtype: list[str]
+        """
+        names = []
+        nodes = [self._root]
+        for token in cleaned:
+            nodes = [child for children, _ in nodes for child in (children.get(token), children.get(self.WILDCARD))
+                     if child is not None]
+            if len(nodes) == 0:
+                return names
+
+        names = [name for _, node_names in nodes for name in node_names]
+        return sorted(names, key=self._order.get) if len(names) > 1 else names
+
+
+class StataScanner:
+    def __init__(self, isolators):
+        """
+        Isolates the raw tables of many table types in a single pass of the log.
+
+        Each line is cleaned once, and then walked through a token trie of every divider, so recognising the start of
+        a table costs the same however many table types are being isolated.
+
+        :param isolators: The Extraction elements for each table type, keyed by the table type name
+        :type isolators: dict[str, ExtractTable]
+        """
+        self._iso = isolators
+        self._trie = DividerTrie(isolators)
+
+        # Tables that have been started, in the order they were found in the log, and the current line index and offset
+        self._active = deque()
+        self._index = 0
+        self._offset = 0
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataScanner for {list(self._iso.keys())}"
+
+    @property
+    def lines_scanned(self):
+        """The number of lines fed to the scanner"""
+        return self._index
+
+    @property
+    def bytes_read(self):
+        """The number of bytes fed to the scanner"""
+        return self._offset
+
+    def feed(self, line, size=0):
+        """
+        Feed the next line of the log to the scanner
+
+        :param line: The next line of the log file
+        :type line: str
+
+        :param size: The size of the line in bytes, used to record the byte range of each table. Defaults to 0
+        :type size: int
+
+        :return: Any tables that have been completed by this line, in the order they were started in the log
+        :rtype: list[RawTable]
+        """
+        cleaned = clean_line(line)
+        line_end = self._offset + size
+
+        # Add this line to all the tables currently being collected
+        for table in self._active:
+            if not table.complete and table.add_line(cleaned):
+                table.end = line_end
+
+        # Start new tables for any dividers found on this line
+        for name in self._trie.match(cleaned):
+            table = RawTable(name, self._iso[name].separator, self._index, self._offset)
+            table.add_line(cleaned)
+            self._active.append(table)
+
+        self._index += 1
+        self._offset = line_end
+        return self._pop_complete()
+
+    def close(self):
+        """
+        The end of the log has been reached, so any tables still being collected are complete
+
+        :return: The remaining tables, in the order they were started in the log
+        :rtype: list[RawTable]
+        """
+        for table in self._active:
+            if not table.complete:
+                table.complete = True
+                table.end = self._offset
+        return self._pop_complete()
+
+    def _pop_complete(self):
+        """Remove completed tables from the front of the active tables so that tables are returned in log order"""
+        completed = []
+        while len(self._active) > 0 and self._active[0].complete:
+            completed.append(self._active.popleft())
+        return completed
+
+    def scan(self, log_path, log_file=None):
+        """
+        Scan a log file, yielding each table as it is completed. Compressed logs and members of archives are
+        decompressed as they are read, see Supports.open_log
+
+        :param log_path: The path to the log file
+        :type log_path: Path
+
+        :param log_file: An open binary stream of the log to read rather than opening log_path, such as a member of an
+            archive from Supports.iter_archive. Defaults to None
+        :type log_file: io.BufferedIOBase | None
+
+        :return: A generator of RawTable's, in the order they were started in the log
+        """
+        if log_file is None:
+            with open_log(log_path) as log_file:
+                yield from self.scan(log_path, log_file)
+            return
+
+        for line in log_file:
+            yield from self.feed(decode_line(line), len(line))
+        yield from self.close()
@@ -0,0 +1,250 @@
+from stataLogObject.Configs.VariableHolders import RandomParameters, GroupParameter
+from stataLogObject.StataParser.StataLogCollection import StataLogCollection, _parse_log, _parse_archive
+from stataLogObject.Supports import find_sources, log_stat
+
+from functools import partial
+from pathlib import Path
+import sqlite3
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    log_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER,
+    mtime_ns INTEGER,
+    ingested REAL
+);
+CREATE TABLE IF NOT EXISTS tables (
+    table_id INTEGER PRIMARY KEY,
+    log_id INTEGER NOT NULL REFERENCES logs(log_id) ON DELETE CASCADE,
+    table_type TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    phenotype TEXT
+);
+CREATE TABLE IF NOT EXISTS model_fit (
+    table_id INTEGER NOT NULL REFERENCES tables(table_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value
+);
+CREATE TABLE IF NOT EXISTS body (
+    table_id INTEGER NOT NULL REFERENCES tables(table_id) ON DELETE CASCADE,
+    row INTEGER NOT NULL,
+    var_name TEXT,
+    field TEXT NOT NULL,
+    value
+);
+CREATE TABLE IF NOT EXISTS random_parameters (
+    table_id INTEGER NOT NULL REFERENCES tables(table_id) ON DELETE CASCADE,
+    level INTEGER NOT NULL,
+    name TEXT,
+    estimate,
+    std_err,
+    lb_95,
+    ub_95
+);
+CREATE TABLE IF NOT EXISTS group_parameters (
+    table_id INTEGER NOT NULL REFERENCES tables(table_id) ON DELETE CASCADE,
+    level INTEGER NOT NULL,
+    group_variable TEXT,
+    groups,
+    obs_min,
+    obs_avg,
+    obs_max
+);
+CREATE INDEX IF NOT EXISTS tables_log ON tables(log_id);
+CREATE INDEX IF NOT EXISTS tables_phenotype ON tables(phenotype);
+CREATE INDEX IF NOT EXISTS model_fit_table ON model_fit(table_id);
+CREATE INDEX IF NOT EXISTS body_table ON body(table_id);
+CREATE INDEX IF NOT EXISTS body_var_name ON body(var_name);
+CREATE INDEX IF NOT EXISTS random_parameters_table ON random_parameters(table_id);
+CREATE INDEX IF NOT EXISTS group_parameters_table ON group_parameters(table_id);
+"""
+
+
+class StataStore:
+    def __init__(self, database_path, timeout=30.0):
+        """
+        A SQLite store of parsed logs, so results can be queried across many logs without parsing them again
+
+        Note
+        ----
+        The schema is normalised into logs, tables, model_fit, body, random_parameters and group_parameters, each linked
+        by log_id or table_id. The body is stored in long form, with one row per variable and field, so every table
+        type shares the same schema. Each log is written with batched inserts inside a single transaction, and the
+        database uses write ahead logging with a busy timeout so that several processes can ingest at once.
+
+        :param database_path: The path to the SQLite database, which is created if it does not exist
+        :type database_path: str | Path
+
+        :param timeout: The number of seconds to wait for another process to finish writing, defaults to 30
+        :type timeout: float
+        """
+        self.database_path = Path(database_path)
+        self.timeout = timeout
+
+        # Transactions are managed explicitly, so that the write lock is taken at the start of each one
+        self.connection = sqlite3.connect(self.database_path, timeout=timeout, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def __repr__(self):
+        """Human readable output"""
+        return f"StataStore at {self.database_path} with {len(self.logs())} logs"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the connection to the database"""
+        self.connection.close()
+
+    def logs(self):
+        """The path of each log in the store"""
+        return [Path(path) for path, in self.connection.execute("SELECT path FROM logs ORDER BY path")]
+
+    def query(self, sql, parameters=()):
+        """
+        Run a query against the store
+
+        :param sql: The SQL query
+        :type sql: str
+
+        :param parameters: The parameters of the query, defaults to ()
+        :type parameters: tuple | dict
+
+        :return: The rows of the result
+        :rtype: list[tuple]
+        """
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def add_log(self, log):
+        """
+        Write every table of a log to the store, replacing any previous version of this log
+
+        :param log: The log to write
+        :type log: StataLog
+
+        :return: The log_id of the log
+        :rtype: int
+        """
+        log_path = str(log.log_path.resolve())
+        stat = log_stat(log.log_path)
+        table_types = log.table_types()
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.execute("DELETE FROM logs WHERE path = ?", (log_path,))
+            log_id = self.connection.execute(
+                "INSERT INTO logs (path, size, mtime_ns, ingested) VALUES (?, ?, ?, ?)",
+                (log_path, stat.st_size, stat.st_mtime_ns, time.time())).lastrowid
+
+            # The write lock is held, so table ids can be assigned here and every table inserted in a single batch
+            next_id, = self.connection.execute("SELECT COALESCE(MAX(table_id), 0) + 1 FROM tables").fetchone()
+            tables = [(table_id, table_type, ordinal, table) for table_id, (table_type, ordinal, table) in enumerate(
+                [(t, i, table) for t, type_tables in table_types.items() for i, table in enumerate(type_tables)],
+                next_id)]
+
+            self.connection.executemany(
+                "INSERT INTO tables (table_id, log_id, table_type, ordinal, phenotype) VALUES (?, ?, ?, ?, ?)",
+                [(table_id, log_id, table_type, ordinal, table.phenotype) for table_id, table_type, ordinal, table
+                 in tables])
+            self._add_model_fit(tables)
+            self._add_body(tables)
+
+            self.connection.execute("COMMIT")
+            return log_id
+
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def _add_model_fit(self, tables):
+        """Write the model fit of each table, with random and group parameters written to their own tables"""
+        model_fit, random_parameters, group_parameters = [], [], []
+        for table_id, _, _, table in tables:
+            for name, value in table.model_fit.items():
+                if isinstance(value, RandomParameters):
+                    random_parameters += [(table_id, level, *parameter) for level, parameter in
+                                          enumerate(value.parameters)]
+                elif isinstance(value, GroupParameter):
+                    group_parameters += [(table_id, level, *parameter) for level, parameter in
+                                         enumerate(value.parameters)]
+                else:
+                    model_fit.append((table_id, name, value))
+
+        self.connection.executemany("INSERT INTO model_fit (table_id, name, value) VALUES (?, ?, ?)", model_fit)
+        self.connection.executemany(
+            "INSERT INTO random_parameters (table_id, level, name, estimate, std_err, lb_95, ub_95) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)", random_parameters)
+        self.connection.executemany(
+            "INSERT INTO group_parameters (table_id, level, group_variable, groups, obs_min, obs_avg, obs_max) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)", group_parameters)
+
+    def _add_body(self, tables):
+        """Write the body of each table in long form, with one row per variable and field"""
+        body = []
+        for table_id, _, _, table in tables:
+            var_names = table.table_columns["var_name"].tolist()
+            rows = range(len(var_names))
+            for field, column in table.table_columns.items():
+                if field != "var_name":
+                    body += zip([table_id] * len(var_names), rows, var_names, [field] * len(var_names), column.tolist())
+
+        self.connection.executemany("INSERT INTO body (table_id, row, var_name, field, value) VALUES (?, ?, ?, ?, ?)",
+                                    body)
+
+    def add_collection(self, collection):
+        """
+        Write every log of a collection to the store, each in its own transaction
+
+        :param collection: The parsed logs
+        :type collection: stataLogObject.StataLogCollection
+
+        :return: The log_id of each log, keyed by their log path
+        :rtype: dict[Path, int]
+        """
+        return {log_path: self.add_log(log) for log_path, log in collection.logs.items()}
+
+    def ingest_directory(self, directory, workers=None, pattern="*.log", recursive=True, memory_map=False,
+                         archives=True):
+        """
+        Parse every log within a directory and write it to the store, with each worker process parsing and writing its
+        own logs
+
+        :param directory: The directory containing the logs
+        :type directory: str | Path
+
+        :param workers: The number of processes to ingest with. Defaults to None, which uses the number of cpus. If 1
+            then logs are ingested in this process.
+        :type workers: int | None
+
+        :param pattern: The glob pattern logs must match, defaults to *.log
+        :type pattern: str
+
+        :param recursive: If True, defaults to True, then sub directories are also searched
+        :type recursive: bool
+
+        :param memory_map: Passed to each StataLog, defaults to False
+        :type memory_map: bool
+
+        :param archives: If True, defaults to True, then the logs within zip and tar archives are also ingested. Each
+            archive is walked once by a single worker, so a compressed tar is only decompressed once
+        :type archives: bool
+
+        :return: The error message of each log that failed to be ingested, keyed by their log path
+        :rtype: dict[Path, str]
+        """
+        # Each worker opens its own connection to write the logs it parses, so parsed logs are never sent back here
+        store = partial(StataStore, self.database_path, self.timeout)
+
+        log_paths, archive_paths = find_sources(directory, pattern, recursive, archives)
+        tasks = [(_parse_log, path, memory_map, store) for path in log_paths]
+        tasks += [(_parse_archive, path, pattern, store) for path in archive_paths]
+        return StataLogCollection._run(tasks, workers, True, False).errors
@@ -3,10 +3,11 @@ from stataLogObject.Configs import Table
 
 from miscSupports import flip_list, write_markdown
 from csvObject import write_csv
+import time
 
 
 class StataTable:
-    def __init__(self, raw_table, config):
+    def __init__(self, raw_table, config, table_type=None, stats=None):
         """
         A generic Stata Table
 
@@ -16,47 +17,82 @@ class StataTable:
         :param config: The attributes of the Table to configure with
         :type config: Table
 
+        :param table_type: The name of this table type within TableConfigs, if known
+        :type table_type: str | None
+
+        :param stats: If set, the time spent extracting the model fit, body and entries is recorded to it, defaults to
+            None
+        :type stats: stataLogObject.Supports.ParseStats | None
         """
 
         # Raw table reference and the configuration for this table
         self._raw = raw_table
         self.config = config
+        self.table_type = table_type
+        self._stats = stats
+
+        # The table body in row form, built from the columns the first time body_values is accessed
+        self._body_values = None
 
         # Set the supporting table header values
         self.model_fit_names = self.config.mf.field_names()
 
-        [setattr(self, f, self._set_mf(f)) for f in self.model_fit_names]
+        # Extraction may blank lines of the raw table, so it is given a shallow copy that only this table owns
+        raw = list(self._raw)
+
+        start = time.perf_counter() if stats is not None else None
+        [setattr(self, f, value) for f, value in self.config.mf.compile().extract(raw).items()]
+        if stats is not None:
+            stats.record("mf", table_type, start, len(raw))
         self.model_fit = {f: getattr(self, f) for f in self.model_fit_names if getattr(self, f) is not None}
 
-        # Extract phenotype, variable names, and the table body in row form
+        # Extract phenotype, variable names, and the table body in column form
         self.table_col_names = self.config.body_iso.body_type.entry_names
-        self.phenotype, self.body_values = self.config.body_iso.extract_body(self._raw)
+        self.phenotype, self.table_columns = self.config.body_iso.extract_columns(raw, stats, table_type)
 
         # Set the column data format
-        [setattr(self, f"tb_{field}", [getattr(v, field) for v in self.body_values])for field in self.table_col_names]
-        self.table_columns = {field: getattr(self, f"tb_{field}") for field in self.table_col_names}
+        [setattr(self, f"tb_{field}", column) for field, column in self.table_columns.items()]
 
     def __repr__(self):
         """Debug string"""
         return f"{self.phenotype}={len(self.table_columns['var_name'])}Var"
 
-    def _set_mf(self, f):
-        """Set a given model fit parameter if it has been set, else return None as this variable was optional"""
-        if not getattr(self.config.mf, f):
-            return None
-        else:
-            return getattr(self.config.mf, f).find_mf(self._raw, f)
+    def __getstate__(self):
+        """
+        The raw table and stats are only required during construction, so are not retained when pickling. The body
+        rows are rebuilt from the columns on first access after unpickling, so they are not retained either
+        """
+        state = self.__dict__.copy()
+        state["_raw"] = None
+        state["_stats"] = None
+        state["_body_values"] = None
+        return state
+
+    @property
+    def body_values(self):
+        """
+        The table body in row form, as an Entry of the body type of this table for each row. The entries are built on
+        first access and then reused, so the time to build them is only recorded once
+        """
+        if self._body_values is None:
+            start = time.perf_counter() if self._stats is not None else None
+            rows = zip(*[column.tolist() for column in self.table_columns.values()])
+            self._body_values = [self.config.body_iso.body_type.create_entry(list(row)) for row in rows]
+            if self._stats is not None:
+                self._stats.record("entry", self.table_type, start, len(self._body_values))
+        return self._body_values
 
     def body_to_csv(self, write_directory, write_name):
         """Write the body as a csv to the write directory called 'write_name'.csv"""
-        write_csv(write_directory, write_name, list(self.table_columns.keys()), flip_list(self.table_columns.values()))
+        columns = [column.tolist() for column in self.table_columns.values()]
+        write_csv(write_directory, write_name, list(self.table_columns.keys()), flip_list(columns))
 
     def forest_format(self, exclusions=None):
         """Format the data as a forest plot would require, specifically designed for pyBlendFigures Forest"""
         if sum([1 if h in self.table_columns.keys() else 0 for h in FOREST_DICT.keys()]) != len(FOREST_DICT.keys()):
             raise ForestPlotInvalidAttributes(list(self.table_columns.keys()), FOREST_DICT.keys())
 
-        rows_list = flip_list([self.table_columns[key] for key in FOREST_DICT.keys()])
+        rows_list = flip_list([self.table_columns[key].tolist() for key in FOREST_DICT.keys()])
         return [rows_list[i] for i in self._index_forest(exclusions)]
 
     def _index_forest(self, exclusions):
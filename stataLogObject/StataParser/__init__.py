@@ -1,2 +1,6 @@
 from .StataRaw import StataRaw
 from .StataTable import StataTable
+from .StataScanner import StataScanner, RawTable, DividerTrie
+from .StataMap import StataMap
+from .StataFollow import StataFollow
+from .StataIndex import StataIndex, TableMatch
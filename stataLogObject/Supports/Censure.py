@@ -0,0 +1,78 @@
+from stataLogObject.Supports.LogSource import is_plain_log
+from stataLogObject.Supports.Errors import LogNotPlain
+
+from pathlib import Path
+import tempfile
+import shutil
+import os
+import re
+
+
+def censure_file(log_path, patterns=None, replacement="[censured]", chunk_size=1 << 20):
+    """
+    Logs from stata often contain a path which can be problematic if they are to sensitive locations so this censures
+    them, alongside anything else that matches one of the patterns.
+
+    Note
+    ----
+    The log is streamed in chunks of lines into a temporary file in the same directory, which then replaces the log via
+    an atomic rename. Memory use is therefore independent of the size of the log, and if this fails part way the
+    original log is left untouched. Line endings and any undecodable bytes are preserved. If log_path is a symlink, the
+    file it links to is rewritten and the link itself is kept.
+
+    :param log_path: The path to the log file
+    :type log_path: str | Path
+
+    :param patterns: Regular expressions, whose matches will be replaced with replacement. Defaults to None
+    :type patterns: list[str] | None
+
+    :param replacement: The replacement for matches of patterns, defaults to [censured]
+    :type replacement: str
+
+    :param chunk_size: The approximate number of bytes of lines to process at a time, defaults to 1MB
+    :type chunk_size: int
+
+    :return: Nothing, override the log file
+    :rtype: None
+
+    :raises LogNotPlain: If the log is compressed or within an archive, as only an uncompressed log can be rewritten
+    """
+    log_path = Path(log_path)
+    if not is_plain_log(log_path):
+        raise LogNotPlain(log_path)
+
+    # Replacing a symlink would swap the link for a regular file, so the file it links to is rewritten instead
+    log_path = log_path.resolve()
+    patterns = [re.compile(pattern) for pattern in ([] if patterns is None else patterns)]
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=log_path.parent, prefix=f".{log_path.name}.", suffix=".tmp")
+    try:
+        # The descriptor is wrapped before the log is opened, so it is closed even if the log cannot be opened
+        with os.fdopen(file_descriptor, "w", encoding="utf-8", errors="surrogateescape", newline="") as temp_file, \
+                open(log_path, "r", encoding="utf-8", errors="surrogateescape", newline="") as log_file:
+            for lines in iter(lambda: log_file.readlines(chunk_size), []):
+                temp_file.writelines([_censure_line(line, patterns, replacement) for line in lines])
+
+        shutil.copymode(log_path, temp_path)
+        os.replace(temp_path, log_path)
+
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _censure_line(line, patterns, replacement):
+    """
+    Remove the path to log: locations, then replace any matches of the patterns within the line, excluding its line
+    ending
+    """
+    content = line.rstrip("\r\n")
+    ending = line[len(content):]
+
+    if "log:" in content:
+        content = f"{content.split(':')[0]}: "
+        ending = ending if len(ending) > 0 else "\n"
+
+    for pattern in patterns:
+        content = pattern.sub(replacement, content)
+    return content + ending
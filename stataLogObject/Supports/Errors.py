@@ -20,4 +20,21 @@ class EntryLengthInvalid(Exception):
 class ForestPlotInvalidAttributes(Exception):
     def __init__(self, column_attributes, forest_columns):
         super(ForestPlotInvalidAttributes, self).__init__(
-            f"\n\tFailed to find all of {forest_columns} in {column_attributes}")
\ No newline at end of file
+            f"\n\tFailed to find all of {forest_columns} in {column_attributes}")
+
+
+class TableTypeRegistered(Exception):
+    def __init__(self, name, reserved=False):
+        if reserved:
+            super(TableTypeRegistered, self).__init__(
+                f"\n\t{name} is an attribute of StataLog, so cannot be used as a table type name")
+        else:
+            super(TableTypeRegistered, self).__init__(
+                f"\n\tA table type called {name} is already registered, pass replace=True to replace it")
+
+
+class LogNotPlain(Exception):
+    def __init__(self, log_path):
+        super(LogNotPlain, self).__init__(
+            f"\n\t{log_path} is compressed or within an archive, so cannot be rewritten in place. Decompress or "
+            f"extract it first")
@@ -0,0 +1,267 @@
+from contextlib import contextmanager, ExitStack
+from fnmatch import fnmatch
+from pathlib import Path
+import posixpath
+import tarfile
+import zipfile
+import bz2
+import gzip
+import lzma
+import io
+
+
+# Compressed log suffixes, alongside a function that wraps a binary stream of the compressed bytes
+COMPRESSIONS = {
+    ".gz": lambda stream: gzip.GzipFile(fileobj=stream),
+    ".bz2": lambda stream: bz2.BZ2File(stream),
+    ".xz": lambda stream: lzma.LZMAFile(stream),
+    ".zst": lambda stream: _zstd_reader(stream)
+}
+
+# Zstd compressed tar archives, which tarfile cannot decompress itself so are read via zstandard
+ZSTD_ARCHIVES = (".tar.zst", ".tzst")
+
+ARCHIVES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz") + ZSTD_ARCHIVES
+
+
+def _zstd_reader(stream):
+    """Wrap a binary stream of zstd compressed bytes, requires zstandard"""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard is required for .zst logs and .tar.zst archives, install it via pip install "
+                          "stataLogObject[zstd]")
+
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(stream))
+
+
+def log_name(name):
+    """The name of a log without any compression suffix, so logs.log.gz is logs.log"""
+    for suffix in COMPRESSIONS:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def is_archive(path):
+    """If this path is a zip or tar archive, based on its name"""
+    return Path(path).name.endswith(ARCHIVES)
+
+
+def split_archive_path(log_path):
+    """
+    A member of an archive is given as the path of the archive followed by the path of the member within it, such as
+    logs.zip/2020/model.log. Split such a path into the archive path and the member name.
+
+    :param log_path: The path to the log, or to a member of an archive
+    :type log_path: str | Path
+
+    :return: The archive path and member name, or the log path and None if it is not a member of an archive
+    :rtype: (Path, str | None)
+    """
+    log_path = Path(log_path)
+    if log_path.exists():
+        return log_path, None
+
+    for i, parent in enumerate(log_path.parents):
+        if parent.is_file() and is_archive(parent):
+            return parent, "/".join(log_path.parts[-(i + 1):])
+    return log_path, None
+
+
+def is_log_path(log_path):
+    """If this path is a .log, a compressed .log, or a .log member of an archive"""
+    return log_name(Path(log_path).name).endswith(".log")
+
+
+def log_exists(log_path):
+    """
+    If the log exists. For a member of an archive this is if the archive exists, as checking for the member of a
+    compressed tar requires decompressing it
+    """
+    source, _ = split_archive_path(log_path)
+    return source.is_file()
+
+
+def log_stat(log_path):
+    """The os.stat_result of the file holding the log, which is the archive for a member of an archive"""
+    return split_archive_path(log_path)[0].stat()
+
+
+def is_plain_log(log_path):
+    """If this log is an uncompressed file on disk, and so can be memory mapped or appended to"""
+    source, member = split_archive_path(log_path)
+    return member is None and log_name(source.name) == source.name
+
+
+@contextmanager
+def open_log(log_path):
+    """
+    Open a log for reading as a binary stream of lines, decompressing it as it is read if required
+
+    Note
+    ----
+    Compressed logs (.log.gz, .log.bz2, .log.xz and .log.zst, which requires zstandard) and members of zip or tar
+    archives, including .tar.zst archives which also require zstandard, are streamed straight from the compressed file,
+    without writing a decompressed copy to disk. Members of an archive may themselves be compressed logs.
+
+    :param log_path: The path to the log, or to a member of an archive
+    :type log_path: str | Path
+
+    :return: A context manager of a binary stream
+    """
+    source, member = split_archive_path(log_path)
+    with ExitStack() as stack:
+        if member is None:
+            stream = stack.enter_context(open(source, "rb"))
+            name = source.name
+
+        elif source.name.endswith(".zip"):
+            archive = stack.enter_context(zipfile.ZipFile(source))
+            info = next((info for info in archive.infolist() if _member_name(info.filename) == member), None)
+            if info is None or info.is_dir():
+                raise KeyError(f"{member} is not a file within {source}")
+            stream = stack.enter_context(archive.open(info))
+            name = member
+
+        else:
+            # Members are read in order, stopping at the requested member, so a compressed tar is not sought backwards
+            archive = stack.enter_context(_open_tar(source))
+            info = next((info for info in archive if _member_name(info.name) == member), None)
+            if info is None or not info.isfile():
+                raise KeyError(f"{member} is not a file within {source}")
+            stream = stack.enter_context(archive.extractfile(info))
+            name = member
+
+        yield _decompress(stream, name, stack)
+
+
+@contextmanager
+def _open_tar(archive_path):
+    """
+    Open a tar archive as a single forward stream of its members, which may be gzip, bz2, xz or zstd compressed. Zstd
+    requires zstandard
+
+    :param archive_path: The path to the tar archive
+    :type archive_path: Path
+
+    :return: A context manager of the tarfile.TarFile
+    """
+    with ExitStack() as stack:
+        if archive_path.name.endswith(ZSTD_ARCHIVES):
+            stream = stack.enter_context(_zstd_reader(stack.enter_context(open(archive_path, "rb"))))
+            yield stack.enter_context(tarfile.open(fileobj=stream, mode="r|"))
+        else:
+            yield stack.enter_context(tarfile.open(archive_path, "r|*"))
+
+
+def _member_name(name):
+    """The name of an archive member as it appears in its log path, so ./logs/model.log is logs/model.log"""
+    return posixpath.normpath(name)
+
+
+def _decompress(stream, name, stack):
+    """Wrap a binary stream in a decompressor if name has a compression suffix, closing it when stack closes"""
+    suffix = name[len(log_name(name)):]
+    return stack.enter_context(COMPRESSIONS[suffix](stream)) if suffix else stream
+
+
+def iter_archive(archive_path, pattern="*.log"):
+    """
+    Walk a zip or tar archive once, yielding each log whose name, without any compression suffix, matches pattern
+
+    Note
+    ----
+    Each stream is only valid until the next log is requested, as tar archives are read as a single forward stream so
+    that a compressed tar is only decompressed once however many logs it contains.
+
+    :param archive_path: The path to the zip or tar archive
+    :type archive_path: str | Path
+
+    :param pattern: The glob pattern member names must match, defaults to *.log
+    :type pattern: str
+
+    :return: A generator of the path of each log, as the archive path followed by the member name, and a binary stream
+        of the log
+    """
+    archive_path = Path(archive_path)
+    if archive_path.name.endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                name = _member_name(info.filename)
+                if not info.is_dir() and fnmatch(log_name(posixpath.basename(name)), pattern):
+                    with ExitStack() as stack:
+                        stream = stack.enter_context(archive.open(info))
+                        yield Path(archive_path, name), _decompress(stream, name, stack)
+    else:
+        with _open_tar(archive_path) as archive:
+            for info in archive:
+                name = _member_name(info.name)
+                if info.isfile() and fnmatch(log_name(posixpath.basename(name)), pattern):
+                    with ExitStack() as stack:
+                        stream = stack.enter_context(archive.extractfile(info))
+                        yield Path(archive_path, name), _decompress(stream, name, stack)
+
+
+def archive_members(archive_path, pattern="*.log"):
+    """
+    The paths of each log within an archive whose name, without any compression suffix, matches pattern
+
+    :param archive_path: The path to the zip or tar archive
+    :type archive_path: str | Path
+
+    :param pattern: The glob pattern member names must match, defaults to *.log
+    :type pattern: str
+
+    :return: The path of each matching member, as the archive path followed by the member name
+    :rtype: list[Path]
+    """
+    archive_path = Path(archive_path)
+    if archive_path.name.endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as archive:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+    else:
+        with _open_tar(archive_path) as archive:
+            names = [info.name for info in archive if info.isfile()]
+
+    names = [_member_name(name) for name in names]
+    return [Path(archive_path, name) for name in names if fnmatch(log_name(posixpath.basename(name)), pattern)]
+
+
+def find_logs(directory, pattern="*.log", recursive=True, archives=True):
+    """
+    Find every log within a directory, including compressed logs and optionally the logs within archives
+
+    :param directory: The directory containing the logs
+    :type directory: str | Path
+
+    :param pattern: The glob pattern log names must match once any compression suffix is removed, defaults to *.log
+    :type pattern: str
+
+    :param recursive: If True, defaults to True, then sub directories are also searched
+    :type recursive: bool
+
+    :param archives: If True, defaults to True, then the logs within zip and tar archives are also included
+    :type archives: bool
+
+    :return: The path of each log, where logs within archives are the archive path followed by the member name
+    :rtype: list[Path]
+    """
+    log_paths, archive_paths = find_sources(directory, pattern, recursive, archives)
+    return sorted(log_paths + [member for path in archive_paths for member in archive_members(path, pattern)])
+
+
+def find_sources(directory, pattern="*.log", recursive=True, archives=True):
+    """
+    Find every log and archive within a directory, without opening the archives, so that each archive can then be read
+    in a single pass via iter_archive. See find_logs for parameters.
+
+    :return: The path of each log, and the path of each zip or tar archive
+    :rtype: (list[Path], list[Path])
+    """
+    directory = Path(directory)
+    paths = [path for path in (directory.rglob("*") if recursive else directory.glob("*")) if path.is_file()]
+
+    log_paths = sorted([path for path in paths if fnmatch(log_name(path.name), pattern)])
+    archive_paths = sorted([path for path in paths if is_archive(path)]) if archives else []
+    return log_paths, archive_paths
@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+import time
+
+
+@dataclass
+class StageStats:
+    """
+    | The accumulated cost of a single parse stage for a single table type
+    |
+    | *Attributes*:
+    |    **calls (int)**: The number of times this stage was run
+    |    **seconds (float)**: The total wall time spent in this stage
+    |    **lines (int)**: The total number of lines processed by this stage
+    |    **bytes (int)**: The total number of bytes read by this stage
+    """
+    calls: int = 0
+    seconds: float = 0.0
+    lines: int = 0
+    bytes: int = 0
+
+
+class ParseStats:
+    def __init__(self):
+        """
+        Opt-in instrumentation of where the time goes when parsing a log. Pass an instance as stats to StataLog and the
+        wall time, lines, bytes and tables found are recorded for each stage and table type:
+
+        | **scan**: Reading the log and isolating the raw tables of every table type, in a single pass
+        | **raw**: The raw tables found for each table type and their lines. These are collected during the scan so
+        |   have no time of their own
+        | **mf**: Extracting the model fit of each table
+        | **body**: Isolating the body lines of each table and cleaning them into columns
+        | **entry**: Constructing an Entry for each row of a table body
+
+        Every call site is guarded by a check that stats is not None, so there is no timing cost when it is not used.
+        """
+        self.stages = {}
+
+    def __repr__(self):
+        """Human readable output"""
+        return "\n".join([f"{stage:<6} {str(table_type):<10} calls={s.calls:<8} seconds={s.seconds:<10.4f} "
+                          f"lines={s.lines:<10} bytes={s.bytes}"
+                          for (stage, table_type), s in sorted(self.stages.items(), key=lambda kv: str(kv[0]))])
+
+    def stage(self, stage, table_type=None):
+        """
+        The stats of a stage for a table type, where a table type of None is a stage that covers every table type
+
+        :rtype: StageStats
+        """
+        key = (stage, table_type)
+        if key not in self.stages:
+            self.stages[key] = StageStats()
+        return self.stages[key]
+
+    def record(self, stage, table_type, start, lines=0, read_bytes=0):
+        """
+        Record a call of a stage that started at start, as returned by time.perf_counter
+
+        :param stage: The name of the stage
+        :type stage: str
+
+        :param table_type: The table type name, or None if the stage covers every table type
+        :type table_type: str | None
+
+        :param start: The time.perf_counter value when the stage started, or None if the time of this stage has already
+            been recorded, such as via timed
+        :type start: float | None
+
+        :param lines: The number of lines processed, defaults to 0
+        :type lines: int
+
+        :param read_bytes: The number of bytes read, defaults to 0
+        :type read_bytes: int
+
+        :return: Nothing, updates the stats of this stage
+        :rtype: None
+        """
+        elapsed = 0.0 if start is None else time.perf_counter() - start
+        stats = self.stage(stage, table_type)
+        stats.calls += 1
+        stats.seconds += elapsed
+        stats.lines += lines
+        stats.bytes += read_bytes
+
+    def timed(self, stage, table_type, iterable):
+        """
+        Wrap an iterable so only the time spent producing each item is recorded against the stage, rather than the time
+        spent by the consumer between items
+
+        :return: A generator of the items of iterable
+        """
+        stats = self.stage(stage, table_type)
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stats.seconds += time.perf_counter() - start
+                return
+            stats.seconds += time.perf_counter() - start
+            yield item
+
+    def scan(self, scanner, log_path, log_file=None):
+        """
+        Scan a log, recording the scan stage alongside the raw tables found for each table type
+
+        :param scanner: The scanner to isolate raw tables with
+        :type scanner: stataLogObject.StataParser.StataScanner | stataLogObject.StataParser.StataMap
+
+        :param log_path: The path to the log file
+        :type log_path: Path
+
+        :param log_file: An open binary stream of the log to read rather than opening log_path, which requires a
+            StataScanner. Defaults to None
+        :type log_file: io.BufferedIOBase | None
+
+        :return: A generator of RawTable's, in the order they were started in the log
+        """
+        raw_tables = scanner.scan(log_path) if log_file is None else scanner.scan(log_path, log_file)
+        for raw in self.timed("scan", None, raw_tables):
+            self.found(raw.name, len(raw.lines))
+            yield raw
+        self.record("scan", None, None, scanner.lines_scanned, scanner.bytes_read)
+
+    def found(self, table_type, lines):
+        """Record a raw table of a table type isolated from the log, and the number of lines it contains"""
+        stats = self.stage("raw", table_type)
+        stats.calls += 1
+        stats.lines += lines
+
+    @property
+    def tables_found(self):
+        """The number of raw tables found for each table type"""
+        return {table_type: stats.calls for (stage, table_type), stats in self.stages.items() if stage == "raw"}
+
+    def totals(self):
+        """
+        The total of each stage across table types
+
+        :return: A dict of stage: StageStats
+        :rtype: dict[str, StageStats]
+        """
+        totals = {}
+        for (stage, _), stats in self.stages.items():
+            total = totals.setdefault(stage, StageStats())
+            total.calls += stats.calls
+            total.seconds += stats.seconds
+            total.lines += stats.lines
+            total.bytes += stats.bytes
+        return totals
@@ -1,2 +1,5 @@
-from .supports import clean_line, extract_values, clean_value, FOREST_DICT, methods_in_line
+from .supports import clean_line, decode_line, extract_values, clean_value, clean_column, FOREST_DICT, methods_in_line
+from .Censure import censure_file
+from .LogSource import open_log, iter_archive, find_logs, find_sources, is_log_path, is_plain_log, log_exists, log_stat
+from .Stats import ParseStats, StageStats
 from .Errors import *
@@ -1,4 +1,5 @@
 from string import ascii_letters
+import numpy as np
 import re
 
 
@@ -11,11 +12,36 @@ def clean_line(line):
     """
     Strip line of new line element then return, replacing negative floats without a 0, -.{value} with -0.{value}
 
+    Note
+    ----
+    This is called on every line of the log, so the split is done by str methods and the negative float fix is only
+    applied to lines that contain a '-.'
+
     :param line: Line in the log file
     :type line: str
     """
-    subbed = "".join([re.sub("\n", "", value) for value in line])
-    return [f"-0.{v[2:]}" if v[0:2] == "-." else v for v in subbed.split(" ") if len(v) > 0]
+    line = line.replace("\n", "")
+    values = list(filter(None, line.split(" ")))
+    if "-." not in line:
+        return values
+    return [f"-0.{v[2:]}" if v[0:2] == "-." else v for v in values]
+
+
+def decode_line(line, encoding="utf-8"):
+    """
+    Decode a line read from a log in binary mode into the form text mode would have given, with windows line endings
+    replaced by a new line element
+
+    :param line: Line in the log file as bytes
+    :type line: bytes
+
+    :param encoding: The encoding of the log file, defaults to utf-8
+    :type encoding: str
+
+    :return: The decoded line
+    :rtype: str
+    """
+    return line.decode(encoding, errors="replace").replace("\r\n", "\n")
 
 
 def extract_values(line, skip=True):
@@ -64,6 +90,37 @@ def clean_value(value):
             return str(value)
 
 
+def clean_column(values):
+    """
+    Clean a column of values from the body of the table in bulk, converting them to a float64 array
+
+    Note
+    ----
+    If any value in the column cannot be converted to a float, such as a missing '.', then the column is returned as an
+    object array of clean_value applied to each value so the non-numeric values are retained.
+
+    :param values: The string representation of each value in this column of the table body
+    :type values: list[str] | tuple[str]
+
+    :return: A float64 array of the column, or an object array if not all values are numeric
+    :rtype: np.ndarray
+    """
+    if len(values) == 0:
+        return np.array([], dtype=np.float64)
+
+    column = np.char.replace(np.array(values, dtype=str), ",", "")
+
+    # Negative zero starting floats without a zero will not convert
+    negative = np.char.startswith(column, "-.")
+    if negative.any():
+        column[negative] = np.char.replace(column[negative], "-.", "-0.", count=1)
+
+    try:
+        return column.astype(np.float64)
+    except ValueError:
+        return np.array([clean_value(value) for value in values], dtype=object)
+
+
 def methods_in_line(var_name, cf, lb, ub, rd=2):
     """
     Construct an in line methods line from a forest plot formatted line
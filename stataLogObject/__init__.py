@@ -1 +1,10 @@
+# Kept in step with VERSION in setup.py, and part of every StataCache key so an upgrade does not load older entries
+__version__ = "0.02.3"
+
 from .StataParser.StataLog import StataLog
+from .StataParser.StataLogCollection import StataLogCollection
+from .StataParser.StataCache import StataCache
+from .Supports.Stats import ParseStats
+from .StataParser.StataStore import StataStore
+from .StataParser.StataAsync import parse_log_async, aiter_tables
+from .Configs.ConfigObj import register_table, unregister_table